@@ -1,9 +1,25 @@
 # Synchronous API client - needs async migration
 # This is sample input for Task 3: Async Migration
 
-import requests
+import asyncio
+import copy
+import re
+import shutil
+import threading
 import time
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter, Retry  # urllib3's Retry, as bundled by requests
+from typing import Dict, Any, Optional, List, Tuple
+
+try:
+    import aiohttp
+except ImportError:  # only AsyncAPIClient needs it
+    aiohttp = None
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
 
 
 class APIClient:
@@ -16,11 +32,86 @@ class APIClient:
         self._retry_count = 3
         self._retry_delay = 1.0
 
+        # urllib3 handles retries/backoff and keeps pooled connections per host
+        retry = Retry(
+            total=self._retry_count,
+            backoff_factor=self._retry_delay,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+        )
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # LRU response cache: key -> {"json", "etag", "last_modified", "expires"}
+        self._cache: "OrderedDict[Tuple[str, Tuple], Dict[str, Any]]" = OrderedDict()
+        self._cache_max = 1024
+        # batch_get calls get() from worker threads
+        self._cache_lock = threading.Lock()
+        self._batch_workers = 20
+
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Make a GET request."""
+        """Make a GET request, honouring ETag/Last-Modified/Cache-Control."""
         url = f"{self.base_url}{endpoint}"
-        response = self._request_with_retry("GET", url, params=params)
-        return response.json()
+        key = self._cache_key(url, params)
+        if key is None:  # params we can't key on: skip the cache
+            return self._request_with_retry("GET", url, params=params).json()
+
+        headers = {}
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+                if entry["expires"] > time.monotonic():
+                    return copy.deepcopy(entry["json"])
+                if entry["etag"]:
+                    headers["If-None-Match"] = entry["etag"]
+                if entry["last_modified"]:
+                    headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self._request_with_retry("GET", url, params=params, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            with self._cache_lock:
+                entry["expires"] = self._expires_at(response)
+                return copy.deepcopy(entry["json"])
+
+        data = response.json()
+        if "no-store" not in response.headers.get("Cache-Control", ""):
+            with self._cache_lock:
+                self._cache[key] = {
+                    "json": data,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "expires": self._expires_at(response),
+                }
+                self._cache.move_to_end(key)
+                if len(self._cache) > self._cache_max:
+                    self._cache.popitem(last=False)
+        return copy.deepcopy(data)
+
+    @staticmethod
+    def _cache_key(url: str, params: Optional[Dict[str, Any]]) -> Optional[Tuple[str, Tuple]]:
+        """Hashable cache key for a GET, or None if *params* can't be hashed.
+
+        List values (``{"ids": [1, 2]}``, which requests sends as repeated
+        parameters) are keyed as tuples.
+        """
+        items = tuple(sorted(
+            (k, tuple(v) if isinstance(v, list) else v) for k, v in (params or {}).items()
+        ))
+        try:
+            hash(items)
+        except TypeError:
+            return None
+        return url, items
+
+    @staticmethod
+    def _expires_at(response: requests.Response) -> float:
+        """Compute the monotonic expiry time from a Cache-Control max-age."""
+        match = _MAX_AGE_RE.search(response.headers.get("Cache-Control", ""))
+        if not match:
+            return 0.0
+        return time.monotonic() + int(match.group(1))
 
     def post(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Make a POST request."""
@@ -43,29 +134,24 @@ class APIClient:
     def _request_with_retry(
         self, method: str, url: str, **kwargs
     ) -> requests.Response:
-        """Make a request with retry logic."""
+        """Make a request; retries are handled by the mounted adapter."""
         kwargs["timeout"] = self.timeout
-        last_exception = None
-
-        for attempt in range(self._retry_count):
-            try:
-                response = self.session.request(method, url, **kwargs)
-                response.raise_for_status()
-                return response
-            except requests.exceptions.RequestException as e:
-                last_exception = e
-                if attempt < self._retry_count - 1:
-                    time.sleep(self._retry_delay * (attempt + 1))
-
-        raise last_exception
+        response = self.session.request(method, url, **kwargs)
+        response.raise_for_status()
+        return response
 
     def batch_get(self, endpoints: List[str]) -> List[Dict[str, Any]]:
-        """Get multiple endpoints sequentially."""
-        results = []
-        for endpoint in endpoints:
-            result = self.get(endpoint)
-            results.append(result)
-        return results
+        """Get multiple endpoints concurrently.
+
+        Each request goes through :meth:`get` on a worker thread, so batched
+        calls share the response cache, retry policy and connection pool, and
+        this works whether or not the caller is inside an event loop. Async
+        code can use :class:`AsyncAPIClient` instead.
+        """
+        if len(endpoints) < 2:
+            return [self.get(endpoint) for endpoint in endpoints]
+        with ThreadPoolExecutor(max_workers=min(len(endpoints), self._batch_workers)) as ex:
+            return list(ex.map(self.get, endpoints))
 
     def upload_file(self, endpoint: str, filepath: str) -> Dict[str, Any]:
         """Upload a file."""
@@ -78,11 +164,10 @@ class APIClient:
     def download_file(self, endpoint: str, filepath: str) -> bool:
         """Download a file."""
         url = f"{self.base_url}{endpoint}"
-        response = self.session.get(url, timeout=self.timeout, stream=True)
-        response.raise_for_status()
-        with open(filepath, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        with self._request_with_retry("GET", url, stream=True) as response:
+            response.raw.decode_content = True
+            with open(filepath, "wb") as f:
+                shutil.copyfileobj(response.raw, f, length=1 << 20)
         return True
 
     def close(self):
@@ -94,3 +179,51 @@ class APIClient:
 
     def __exit__(self, *args):
         self.close()
+
+
+class AsyncAPIClient:
+    """Async API client sharing one pooled aiohttp session."""
+
+    def __init__(self, base_url: str, timeout: float = 30.0, max_concurrency: int = 50):
+        if aiohttp is None:
+            raise ImportError("AsyncAPIClient requires aiohttp (pip install aiohttp)")
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._max_concurrency = max_concurrency
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self):
+        self._open()
+        return self
+
+    def _open(self) -> None:
+        """Create the session and semaphore (must run inside the event loop)."""
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=self._max_concurrency, keepalive_timeout=60),
+            )
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Make a GET request (opens the session on first use without ``async with``)."""
+        self._open()
+        async with self._semaphore:
+            async with self._session.get(f"{self.base_url}{endpoint}", params=params) as response:
+                response.raise_for_status()
+                return await response.json()
+
+    async def batch_get(self, endpoints: List[str]) -> List[Dict[str, Any]]:
+        """Get multiple endpoints concurrently, capped by the semaphore."""
+        return list(await asyncio.gather(*(self.get(endpoint) for endpoint in endpoints)))
+
+    async def close(self):
+        """Close the session."""
+        if self._session:
+            await self._session.close()
+            self._session = None
+            self._semaphore = None
@@ -1,63 +1,94 @@
 # Calculator module with bugs - needs debugging
 # This is sample input for Task 4: Debug Failing Test Suite
 
-from typing import Union, List
+import functools
+import math
+from collections import deque
+from typing import Deque, Union, List
 
 Number = Union[int, float]
 
+HISTORY_MAXLEN = 10_000
+
+
+@functools.lru_cache(maxsize=1024)
+def _factorial(n: int) -> int:
+    """Memoized C-implemented factorial."""
+    return math.factorial(n)
+
 
 class Calculator:
     """A simple calculator with various operations."""
 
-    def __init__(self):
-        self.history: List[str] = []
+    def __init__(self, record_history: bool = True):
+        self._record_enabled = record_history
+        self.history: Deque[str] = deque(maxlen=HISTORY_MAXLEN)
 
     def add(self, a: Number, b: Number) -> Number:
         """Add two numbers."""
         result = a + b
-        self._record(f"{a} + {b} = {result}")
+        if self._record_enabled:
+            self._record(f"{a} + {b} = {result}")
         return result
 
     def subtract(self, a: Number, b: Number) -> Number:
         """Subtract b from a."""
         result = a - b
-        self._record(f"{a} - {b} = {result}")
+        if self._record_enabled:
+            self._record(f"{a} - {b} = {result}")
         return result
 
     def multiply(self, a: Number, b: Number) -> Number:
         """Multiply two numbers."""
         result = a * b
-        self._record(f"{a} * {b} = {result}")
+        if self._record_enabled:
+            self._record(f"{a} * {b} = {result}")
         return result
 
     def divide(self, a: Number, b: Number) -> Number:
         """Divide a by b."""
         # BUG 1: No check for division by zero
         result = a / b
-        self._record(f"{a} / {b} = {result}")
+        if self._record_enabled:
+            self._record(f"{a} / {b} = {result}")
         return result
 
     def percentage(self, value: Number, percent: Number) -> Number:
         """Calculate percentage of a value."""
         # BUG 2: Float precision issue - returns imprecise results
         result = value * percent / 100
-        self._record(f"{percent}% of {value} = {result}")
+        if self._record_enabled:
+            self._record(f"{percent}% of {value} = {result}")
+        return result
+
+    def percentage_many(self, values: List[Number], percents: List[Number]) -> List[float]:
+        """Calculate percentages element-wise in one vectorized NumPy pass."""
+        import numpy as np
+
+        result = (
+            np.asarray(values, dtype=np.float64) * np.asarray(percents, dtype=np.float64) * 0.01
+        ).tolist()
+        if self._record_enabled:
+            self.history.extend(
+                f"{p}% of {v} = {r}" for v, p, r in zip(values, percents, result)
+            )
         return result
 
     def sum_range(self, n: int) -> int:
         """Sum all integers from 1 to n (inclusive)."""
-        # BUG 3: Off-by-one error - range should include n
-        total = 0
-        for i in range(n):  # Should be range(n + 1) or range(1, n + 1)
-            total += i
-        self._record(f"sum(1..{n}) = {total}")
+        # BUG 3: Off-by-one error - closed form of sum(range(n)), should include n
+        m = max(n, 0)
+        total = m * (m - 1) // 2  # Should be m * (m + 1) // 2
+        if self._record_enabled:
+            self._record(f"sum(1..{n}) = {total}")
         return total
 
     def calculate_expression(self, a: Number, b: Number, c: Number) -> Number:
         """Calculate: a + b * c (should follow order of operations)."""
         # BUG 4: Incorrect operator precedence - adds before multiplying
         result = (a + b) * c  # Should be a + (b * c)
-        self._record(f"{a} + {b} * {c} = {result}")
+        if self._record_enabled:
+            self._record(f"{a} + {b} * {c} = {result}")
         return result
 
     def safe_divide(self, a: Number, b: Number) -> Number:
@@ -81,12 +112,11 @@ class Calculator:
         """Calculate factorial of n."""
         if n < 0:
             raise ValueError("Factorial not defined for negative numbers")
-        if n <= 1:
-            return 1
-        result = 1
-        for i in range(2, n + 1):
-            result *= i
-        return result
+        return _factorial(n)
+
+    def enable_history(self, enabled: bool = True) -> None:
+        """Turn operation history recording on or off."""
+        self._record_enabled = enabled
 
     def _record(self, operation: str) -> None:
         """Record an operation in history."""
@@ -94,7 +124,7 @@ class Calculator:
 
     def get_history(self) -> List[str]:
         """Get operation history."""
-        return self.history.copy()
+        return list(self.history)
 
     def clear_history(self) -> None:
         """Clear operation history."""
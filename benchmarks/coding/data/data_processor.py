@@ -1,19 +1,47 @@
 # Legacy data processor module - needs refactoring
 # This is sample input for Task 1: Python Module Refactoring
 
-import json
 import csv
+import json
 import time
+from itertools import islice
+
+try:
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None
+
+try:
+    import pandas as pd
+except ImportError:  # columnar CSV path is optional
+    pd = None
+
+try:
+    import pyarrow  # noqa: F401 - backs pandas' engine='pyarrow' CSV parser
+except ImportError:
+    pyarrow = None
 
 BATCH_SIZE = 100
 TIMEOUT = 30.0
 RETRY_COUNT = 3
+NDJSON_SUFFIXES = ('.jsonl', '.ndjson')
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+def _json_line(record):
+    """One record as a newline-terminated UTF-8 JSON line."""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, separators=(',', ':'), ensure_ascii=False) + '\n').encode('utf-8')
 
 def load_data(filepath):
     """Load data from file."""
     if filepath.endswith('.json'):
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        with open(filepath, 'rb') as f:
+            return _json_loads(f.read())
+    elif filepath.endswith(NDJSON_SUFFIXES):
+        with open(filepath, 'rb') as f:
+            return [_json_loads(line) for line in f if line.strip()]
     elif filepath.endswith('.csv'):
         with open(filepath, 'r') as f:
             reader = csv.DictReader(f)
@@ -21,6 +49,19 @@ def load_data(filepath):
     else:
         raise ValueError("Unsupported file format: %s" % filepath)
 
+def load_data_iter(filepath):
+    """Yield records from file one at a time (CSV/JSONL stream; JSON is parsed whole)."""
+    if filepath.endswith('.csv'):
+        with open(filepath, 'r') as f:
+            yield from csv.DictReader(f)
+    elif filepath.endswith(NDJSON_SUFFIXES):
+        with open(filepath, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield _json_loads(line)
+    else:
+        yield from load_data(filepath)
+
 def validate_record(record):
     """Validate a single record."""
     if not record:
@@ -40,38 +81,93 @@ def transform_record(record):
     result['timestamp'] = time.time()
     return result
 
-def process_batch(records):
+def process_batch(records, timestamp=None):
     """Process a batch of records."""
-    results = []
-    for record in records:
-        if validate_record(record):
-            transformed = transform_record(record)
-            results.append(transformed)
-    return results
+    # Single pass with validate_record/transform_record inlined; one timestamp per batch
+    ts = time.time() if timestamp is None else timestamp
+    _str = str
+    _get = dict.get
+    return [
+        {
+            'id': _str(_get(r, 'id', '')),
+            'name': _get(r, 'name', '').strip().title(),
+            'email': _get(r, 'email', '').lower(),
+            'timestamp': ts,
+        }
+        for r in records
+        if r and 'id' in r and 'name' in r
+    ]
 
 def process_data(data):
     """Main entry point - process all data."""
     all_results = []
-    for i in range(0, len(data), BATCH_SIZE):
-        batch = data[i:i + BATCH_SIZE]
-        batch_results = process_batch(batch)
-        all_results.extend(batch_results)
-        print("Processed batch %d, total records: %d" % (i // BATCH_SIZE + 1, len(all_results)))
+    it = iter(data)
+    batch_num = 0
+    while True:
+        batch = list(islice(it, BATCH_SIZE))
+        if not batch:
+            break
+        batch_num += 1
+        all_results.extend(process_batch(batch))
+        print("Processed batch %d, total records: %d" % (batch_num, len(all_results)))
     return all_results
 
+def process_data_iter(records):
+    """Streaming process_data: yield transformed records batch by batch."""
+    it = iter(records)
+    while True:
+        batch = list(islice(it, BATCH_SIZE))
+        if not batch:
+            return
+        yield from process_batch(batch)
+
+def load_frame(filepath):
+    """Load a CSV into a DataFrame using the pyarrow parser (all columns as str)."""
+    return pd.read_csv(filepath, dtype=str, keep_default_na=False, engine='pyarrow')
+
+def process_frame(df):
+    """Vectorized equivalent of process_data for a DataFrame of CSV rows."""
+    if 'id' not in df.columns or 'name' not in df.columns:
+        return df.iloc[0:0]
+    mask = df['id'].notna() & df['name'].notna()
+    email = df.loc[mask, 'email'] if 'email' in df.columns else ''
+    out = pd.DataFrame({
+        'id': df.loc[mask, 'id'].astype(str),
+        'name': df.loc[mask, 'name'].str.strip().str.title(),
+        'email': email.str.lower() if 'email' in df.columns else email,
+        'timestamp': time.time(),
+    })
+    print("Processed %d records" % len(out))
+    return out
+
 def save_results(results, filepath):
-    """Save results to file."""
-    with open(filepath, 'w') as f:
-        json.dump(results, f, indent=2)
-    print("Saved %d records to %s" % (len(results), filepath))
+    """Save results (any iterable) to file.
+
+    .jsonl/.ndjson targets are streamed as NDJSON (one record per line);
+    anything else gets a JSON array, as load_data expects for .json.
+    """
+    if not filepath.endswith(NDJSON_SUFFIXES):
+        results = list(results)
+        with open(filepath, 'w') as f:
+            json.dump(results, f, indent=2)
+        print("Saved %d records to %s" % (len(results), filepath))
+        return
+    count = 0
+    with open(filepath, 'wb') as f:
+        for record in results:
+            f.write(_json_line(record))
+            count += 1
+    print("Saved %d records to %s" % (count, filepath))
 
 def run_pipeline(input_path, output_path):
     """Run the full processing pipeline."""
     retries = 0
     while retries < RETRY_COUNT:
         try:
-            data = load_data(input_path)
-            results = process_data(data)
+            if pd is not None and pyarrow is not None and input_path.endswith('.csv'):
+                results = process_frame(load_frame(input_path)).to_dict(orient='records')
+            else:
+                results = process_data_iter(load_data_iter(input_path))
             save_results(results, output_path)
             return True
         except Exception as e:
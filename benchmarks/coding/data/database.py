@@ -2,7 +2,8 @@
 # This is sample input for Task 2: Add Unit Tests
 
 import uuid
-from typing import Optional, List, Dict, Any
+from itertools import islice
+from typing import Any, Callable, Dict, List, Optional, Set
 
 
 class Database:
@@ -10,6 +11,12 @@ class Database:
 
     def __init__(self):
         self._collections: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # Secondary indexes: "users:email" maps email (exact, case-sensitive)
+        # -> ids of the documents holding it. Documents may be mutated in place
+        # before update(), so the email each id was indexed under is tracked
+        # separately for removal.
+        self._indexes: Dict[str, Dict[str, Set[str]]] = {}
+        self._indexed_emails: Dict[str, str] = {}
 
     def generate_id(self) -> str:
         """Generate a unique ID."""
@@ -22,8 +29,23 @@ class Database:
 
         doc_id = document.get("id", self.generate_id())
         self._collections[collection][doc_id] = document
+        if collection == "users":
+            self._index_email(doc_id, document)
         return doc_id
 
+    def insert_many(self, collection: str, documents: List[Dict[str, Any]]) -> List[str]:
+        """Insert several documents into a collection. Returns their IDs."""
+        docs = self._collections.setdefault(collection, {})
+        index_emails = collection == "users"
+        doc_ids = []
+        for document in documents:
+            doc_id = document["id"] if "id" in document else self.generate_id()
+            docs[doc_id] = document
+            if index_emails:
+                self._index_email(doc_id, document)
+            doc_ids.append(doc_id)
+        return doc_ids
+
     def find_by_id(self, collection: str, doc_id: str) -> Optional[Dict[str, Any]]:
         """Find a document by ID."""
         if collection not in self._collections:
@@ -32,9 +54,14 @@ class Database:
 
     def find_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """Find a user by email (users collection only)."""
-        if "users" not in self._collections:
+        doc_ids = self._indexes.get("users:email", {}).get(email)
+        if not doc_ids:
             return None
-        for doc in self._collections["users"].values():
+        users = self._collections.get("users", {})
+        if len(doc_ids) == 1:
+            return users.get(next(iter(doc_ids)))
+        # Several users share the email: the first in collection order wins
+        for doc in users.values():
             if doc.get("email") == email:
                 return doc
         return None
@@ -43,10 +70,23 @@ class Database:
         self, collection: str, limit: int = 100, offset: int = 0
     ) -> List[Dict[str, Any]]:
         """Find all documents in a collection with pagination."""
-        if collection not in self._collections:
+        docs = self._collections.get(collection)
+        if docs is None:
             return []
-        docs = list(self._collections[collection].values())
-        return docs[offset : offset + limit]
+        return list(islice(docs.values(), offset, offset + limit))
+
+    def find_where(
+        self,
+        collection: str,
+        predicate: Callable[[Dict[str, Any]], bool],
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """Find documents matching predicate, paginating over the matches."""
+        docs = self._collections.get(collection)
+        if docs is None:
+            return []
+        return list(islice(filter(predicate, docs.values()), offset, offset + limit))
 
     def update(self, collection: str, doc_id: str, document: Dict[str, Any]) -> bool:
         """Update a document."""
@@ -55,6 +95,8 @@ class Database:
         if doc_id not in self._collections[collection]:
             return False
         self._collections[collection][doc_id] = document
+        if collection == "users":
+            self._index_email(doc_id, document)
         return True
 
     def delete(self, collection: str, doc_id: str) -> bool:
@@ -64,6 +106,8 @@ class Database:
         if doc_id not in self._collections[collection]:
             return False
         del self._collections[collection][doc_id]
+        if collection == "users":
+            self._unindex_email(doc_id)
         return True
 
     def count(self, collection: str) -> int:
@@ -77,5 +121,29 @@ class Database:
         if collection:
             if collection in self._collections:
                 self._collections[collection] = {}
+            if collection == "users":
+                self._indexes.pop("users:email", None)
+                self._indexed_emails = {}
         else:
             self._collections = {}
+            self._indexes = {}
+            self._indexed_emails = {}
+
+    def _index_email(self, doc_id: str, document: Dict[str, Any]) -> None:
+        """Point the email index at doc_id, dropping any stale entry."""
+        self._unindex_email(doc_id)
+        email = document.get("email")
+        if email:
+            self._indexes.setdefault("users:email", {}).setdefault(email, set()).add(doc_id)
+            self._indexed_emails[doc_id] = email
+
+    def _unindex_email(self, doc_id: str) -> None:
+        """Remove doc_id's entry from the email index."""
+        email = self._indexed_emails.pop(doc_id, None)
+        if email is not None:
+            index = self._indexes.get("users:email", {})
+            doc_ids = index.get(email)
+            if doc_ids is not None:
+                doc_ids.discard(doc_id)
+                if not doc_ids:
+                    del index[email]
@@ -1,17 +1,76 @@
 # Synchronous file handler - needs async migration
 # This is sample input for Task 3: Async Migration
 
-import os
+import asyncio
 import json
-from typing import Any, List, Optional
+import os
+import shutil
+from typing import Any, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None
+
+try:
+    import aiofiles
+except ImportError:  # only AsyncFileHandler needs it
+    aiofiles = None
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes with orjson when available."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps(data: Any, indent: Optional[int]) -> str:
+    """Serialize *data* to JSON text.
+
+    orjson handles the indents it supports (none or 2 spaces); other indents,
+    and data orjson rejects (e.g. integers beyond 64 bits), use the json module.
+    """
+    if orjson is not None and indent in (None, 0, 2):
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(data, option=option).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(data, indent=indent)
+
+
+def _list_files(full_path: str, pattern: Optional[str]) -> List[str]:
+    """Names of the files in *full_path*, optionally containing *pattern*."""
+    # DirEntry.is_file() reuses the readdir() type info instead of a stat() per entry
+    with os.scandir(full_path) as entries:
+        return [
+            entry.name
+            for entry in entries
+            if entry.is_file() and (pattern is None or pattern in entry.name)
+        ]
 
-class FileHandler:
-    """Synchronous file operations handler."""
+
+class _BasePathHandler:
+    """Path helpers shared by FileHandler and AsyncFileHandler."""
 
     def __init__(self, base_path: str = "."):
         self.base_path = os.path.abspath(base_path)
 
+    def _get_full_path(self, filepath: str) -> str:
+        """Get the full path for a file."""
+        if os.path.isabs(filepath):
+            return filepath
+        return os.path.join(self.base_path, filepath)
+
+    def _ensure_directory(self, filepath: str) -> None:
+        """Ensure the directory for a file exists."""
+        directory = os.path.dirname(filepath)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+
+class FileHandler(_BasePathHandler):
+    """Synchronous file operations handler."""
+
     def read_text(self, filepath: str) -> str:
         """Read a text file."""
         full_path = self._get_full_path(filepath)
@@ -27,13 +86,11 @@ class FileHandler:
 
     def read_json(self, filepath: str) -> Any:
         """Read and parse a JSON file."""
-        content = self.read_text(filepath)
-        return json.loads(content)
+        return _json_loads(self.read_binary(filepath))
 
     def write_json(self, filepath: str, data: Any, indent: int = 2) -> int:
         """Write data as JSON to a file."""
-        content = json.dumps(data, indent=indent)
-        return self.write_text(filepath, content)
+        return self.write_text(filepath, _json_dumps(data, indent))
 
     def read_lines(self, filepath: str) -> List[str]:
         """Read a file as a list of lines."""
@@ -84,28 +141,114 @@ class FileHandler:
     def list_files(self, directory: str = "", pattern: Optional[str] = None) -> List[str]:
         """List files in a directory."""
         full_path = self._get_full_path(directory) if directory else self.base_path
-        files = []
-        for entry in os.listdir(full_path):
-            entry_path = os.path.join(full_path, entry)
-            if os.path.isfile(entry_path):
-                if pattern is None or pattern in entry:
-                    files.append(entry)
-        return files
+        return _list_files(full_path, pattern)
 
     def copy_file(self, src: str, dst: str) -> bool:
-        """Copy a file."""
-        content = self.read_binary(src)
-        self.write_binary(dst, content)
+        """Copy a file (in-kernel via sendfile where the platform supports it)."""
+        dst_path = self._get_full_path(dst)
+        self._ensure_directory(dst_path)
+        shutil.copyfile(self._get_full_path(src), dst_path)
         return True
 
-    def _get_full_path(self, filepath: str) -> str:
-        """Get the full path for a file."""
-        if os.path.isabs(filepath):
-            return filepath
-        return os.path.join(self.base_path, filepath)
 
-    def _ensure_directory(self, filepath: str) -> None:
-        """Ensure the directory for a file exists."""
-        directory = os.path.dirname(filepath)
-        if directory and not os.path.exists(directory):
-            os.makedirs(directory, exist_ok=True)
+class AsyncFileHandler(_BasePathHandler):
+    """Async file operations handler built on aiofiles.
+
+    Mirrors FileHandler's methods, but every I/O method is a coroutine so
+    independent operations can be awaited concurrently. It is deliberately
+    not a FileHandler subclass: callers expecting the synchronous API must
+    not receive coroutines.
+    """
+
+    def __init__(self, base_path: str = "."):
+        if aiofiles is None:
+            raise ImportError("AsyncFileHandler requires aiofiles (pip install aiofiles)")
+        super().__init__(base_path)
+
+    async def read_text(self, filepath: str) -> str:
+        """Read a text file."""
+        full_path = self._get_full_path(filepath)
+        async with aiofiles.open(full_path, "r", encoding="utf-8") as f:
+            return await f.read()
+
+    async def write_text(self, filepath: str, content: str) -> int:
+        """Write text to a file. Returns bytes written."""
+        full_path = self._get_full_path(filepath)
+        self._ensure_directory(full_path)
+        async with aiofiles.open(full_path, "w", encoding="utf-8") as f:
+            return await f.write(content)
+
+    async def read_json(self, filepath: str) -> Any:
+        """Read and parse a JSON file."""
+        return _json_loads(await self.read_binary(filepath))
+
+    async def write_json(self, filepath: str, data: Any, indent: int = 2) -> int:
+        """Write data as JSON to a file."""
+        return await self.write_text(filepath, _json_dumps(data, indent))
+
+    async def read_lines(self, filepath: str) -> List[str]:
+        """Read a file as a list of lines."""
+        full_path = self._get_full_path(filepath)
+        async with aiofiles.open(full_path, "r", encoding="utf-8") as f:
+            return await f.readlines()
+
+    async def write_lines(self, filepath: str, lines: List[str]) -> int:
+        """Write lines to a file."""
+        full_path = self._get_full_path(filepath)
+        self._ensure_directory(full_path)
+        async with aiofiles.open(full_path, "w", encoding="utf-8") as f:
+            return await f.writelines(lines)
+
+    async def append_text(self, filepath: str, content: str) -> int:
+        """Append text to a file."""
+        full_path = self._get_full_path(filepath)
+        self._ensure_directory(full_path)
+        async with aiofiles.open(full_path, "a", encoding="utf-8") as f:
+            return await f.write(content)
+
+    async def read_binary(self, filepath: str) -> bytes:
+        """Read a binary file."""
+        full_path = self._get_full_path(filepath)
+        async with aiofiles.open(full_path, "rb") as f:
+            return await f.read()
+
+    async def write_binary(self, filepath: str, data: bytes) -> int:
+        """Write binary data to a file."""
+        full_path = self._get_full_path(filepath)
+        self._ensure_directory(full_path)
+        async with aiofiles.open(full_path, "wb") as f:
+            return await f.write(data)
+
+    async def exists(self, filepath: str) -> bool:
+        """Check if a file exists."""
+        return os.path.exists(self._get_full_path(filepath))
+
+    async def delete(self, filepath: str) -> bool:
+        """Delete a file."""
+        full_path = self._get_full_path(filepath)
+        if os.path.exists(full_path):
+            os.remove(full_path)
+            return True
+        return False
+
+    async def list_files(self, directory: str = "", pattern: Optional[str] = None) -> List[str]:
+        """List files in a directory."""
+        full_path = self._get_full_path(directory) if directory else self.base_path
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, _list_files, full_path, pattern)
+
+    async def copy_file(self, src: str, dst: str) -> bool:
+        """Copy a file without buffering it in memory."""
+        dst_path = self._get_full_path(dst)
+        self._ensure_directory(dst_path)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, shutil.copyfile, self._get_full_path(src), dst_path)
+        return True
+
+    async def read_many(self, filepaths: List[str]) -> List[str]:
+        """Read several text files concurrently."""
+        return list(await asyncio.gather(*(self.read_text(p) for p in filepaths)))
+
+    async def write_many(self, items: List[Tuple[str, str]]) -> List[int]:
+        """Write several (filepath, content) pairs concurrently."""
+        return list(await asyncio.gather(*(self.write_text(p, c) for p, c in items)))
@@ -1,20 +1,54 @@
 # User service module - needs unit tests
 # This is sample input for Task 2: Add Unit Tests
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 import hashlib
+import hmac
 import re
 
 
 class UserService:
     """Service for managing user operations."""
 
+    _EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
     def __init__(self, database):
         self.db = database
 
+    @staticmethod
+    def _now_iso() -> str:
+        """Current UTC time as a naive ISO-8601 string (the stored timestamp format)."""
+        return datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+
     def create_user(self, email: str, name: str, password: str) -> Dict[str, Any]:
         """Create a new user."""
+        user = self._build_user(email, name, password, self._now_iso())
+        self.db.insert("users", user)
+        return self._sanitize_user(user)
+
+    def create_users(self, records: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """Create several users from {email, name, password} dicts.
+
+        Every record is validated before anything is inserted, then the
+        batch is written with a single insert_many and one shared timestamp.
+        """
+        created_at = self._now_iso()
+        users = []
+        seen = set()
+        for record in records:
+            user = self._build_user(record["email"], record["name"], record["password"], created_at)
+            if user["email"] in seen:
+                raise ValueError("Email already exists")
+            seen.add(user["email"])
+            users.append(user)
+        self.db.insert_many("users", users)
+        return [self._sanitize_user(u) for u in users]
+
+    def _build_user(
+        self, email: str, name: str, password: str, created_at: str
+    ) -> Dict[str, Any]:
+        """Validate input and build a user document with the given timestamp."""
         if not self._validate_email(email):
             raise ValueError("Invalid email format")
 
@@ -24,17 +58,14 @@ class UserService:
         if self.db.find_by_email(email):
             raise ValueError("Email already exists")
 
-        password_hash = self._hash_password(password)
-        user = {
+        return {
             "id": self.db.generate_id(),
             "email": email.lower(),
             "name": name.strip(),
-            "password_hash": password_hash,
-            "created_at": datetime.utcnow().isoformat(),
+            "password_hash": self._hash_password(password),
+            "created_at": created_at,
             "active": True,
         }
-        self.db.insert("users", user)
-        return self._sanitize_user(user)
 
     def get_user(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get user by ID."""
@@ -70,7 +101,7 @@ class UserService:
             updates["email"] = updates["email"].lower()
 
         user.update(updates)
-        user["updated_at"] = datetime.utcnow().isoformat()
+        user["updated_at"] = self._now_iso()
         self.db.update("users", user_id, user)
         return self._sanitize_user(user)
 
@@ -81,7 +112,7 @@ class UserService:
             return False
 
         user["active"] = False
-        user["deleted_at"] = datetime.utcnow().isoformat()
+        user["deleted_at"] = self._now_iso()
         self.db.update("users", user_id, user)
         return True
 
@@ -94,8 +125,7 @@ class UserService:
         if not user.get("active", True):
             return None
 
-        password_hash = self._hash_password(password)
-        if user.get("password_hash") != password_hash:
+        if not self._verify_password(user, password):
             return None
 
         return self._sanitize_user(user)
@@ -108,8 +138,10 @@ class UserService:
             per_page = 20
 
         offset = (page - 1) * per_page
-        users = self.db.find_all("users", limit=per_page, offset=offset)
-        return [self._sanitize_user(u) for u in users if u.get("active", True)]
+        users = self.db.find_where(
+            "users", lambda u: u.get("active", True), limit=per_page, offset=offset
+        )
+        return [self._sanitize_user(u) for u in users]
 
     def change_password(self, user_id: str, old_password: str, new_password: str) -> bool:
         """Change user password."""
@@ -117,26 +149,39 @@ class UserService:
         if not user:
             raise ValueError("User not found")
 
-        old_hash = self._hash_password(old_password)
-        if user.get("password_hash") != old_hash:
+        if not self._verify_password(user, old_password):
             raise ValueError("Current password is incorrect")
 
         if len(new_password) < 8:
             raise ValueError("Password must be at least 8 characters")
 
         user["password_hash"] = self._hash_password(new_password)
-        user["updated_at"] = datetime.utcnow().isoformat()
+        user["updated_at"] = self._now_iso()
         self.db.update("users", user_id, user)
         return True
 
     def _validate_email(self, email: str) -> bool:
         """Validate email format."""
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        return bool(re.match(pattern, email))
-
-    def _hash_password(self, password: str) -> str:
-        """Hash password with SHA256."""
-        return hashlib.sha256(password.encode()).hexdigest()
+        return self._EMAIL_RE.match(email) is not None
+
+    def _hash_password(self, password: str) -> bytes:
+        """Hash password with SHA256 (raw digest bytes)."""
+        return hashlib.sha256(password.encode("utf-8")).digest()
+
+    def _verify_password(self, user: Dict[str, Any], password: str) -> bool:
+        """Compare a password against the stored hash in constant time.
+
+        Accepts raw digest bytes and the legacy hex-string form.
+        """
+        stored = user.get("password_hash")
+        if isinstance(stored, str):
+            try:
+                stored = bytes.fromhex(stored)
+            except ValueError:
+                return False
+        if not isinstance(stored, bytes):
+            return False
+        return hmac.compare_digest(stored, self._hash_password(password))
 
     def _sanitize_user(self, user: Dict[str, Any]) -> Dict[str, Any]:
         """Remove sensitive fields from user dict."""
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import math
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
 import yaml
 
+try:  # optional C automaton for single-pass keyword matching
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 from benchmarks.models import (
     ALL_AGENTS,
     BENCHMARKS_DIR,
@@ -17,9 +26,111 @@ from benchmarks.models import (
     AgentScorecard,
     BenchmarkResult,
     DomainScore,
+    TaskMetrics,
+    YamlDumper,
+    load_metrics_index,
 )
 
 
+_KEYWORD_RE = re.compile(r"[a-zA-Z]{3,}")
+_CHECKLIST_ITEM_RE = re.compile(r"-\s*\[ ?\]\s*(.+)")
+_TASK_HEADING_RE = re.compile(r"^## Task (\d+):", re.MULTILINE)
+
+
+@lru_cache(maxsize=16)
+def _task_sections(path_str: str, mtime: float) -> Dict[int, str]:
+    """Split expected.md into ``{task_id: section}`` in a single pass.
+
+    Keyed on mtime so edits are picked up.
+    """
+    parts = _TASK_HEADING_RE.split(Path(path_str).read_text())
+    sections: Dict[int, str] = {}
+    for i in range(1, len(parts), 2):
+        sections.setdefault(int(parts[i]), parts[i + 1])
+    return sections
+
+
+@lru_cache(maxsize=256)
+def _checklist_items(domain: str, task_id: int, mtime: float) -> Tuple[Tuple[str, ...], ...]:
+    """Lowercased keywords of each checklist item for one task of expected.md at *mtime*."""
+    expected_path = BENCHMARKS_DIR / domain / "expected.md"
+    section = _task_sections(str(expected_path), mtime).get(task_id)
+    if section is None:
+        return ()
+    # Meaningful keywords are 3+ letter words
+    return tuple(
+        tuple(w.lower() for w in _KEYWORD_RE.findall(item))
+        for item in _CHECKLIST_ITEM_RE.findall(section)
+    )
+
+
+@lru_cache(maxsize=256)
+def _keyword_automaton(checklist: Tuple[Tuple[str, ...], ...]) -> Any:
+    """Aho-Corasick automaton over every keyword of one checklist.
+
+    Returns None when pyahocorasick is not installed.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keywords in checklist:
+        for kw in keywords:
+            automaton.add_word(kw, kw)
+    if len(automaton) == 0:
+        return None
+    automaton.make_automaton()
+    return automaton
+
+
+def _yaml_files(directory: Path) -> List[str]:
+    """Sorted paths of the ``*.yaml`` files directly inside *directory*."""
+    try:
+        with os.scandir(directory) as it:
+            return sorted(e.path for e in it if e.name.endswith(".yaml") and e.is_file())
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+# Below this many checklist items the NumPy call overhead outweighs the win
+_VECTORIZE_MIN_ITEMS = 256
+
+
+def _tally_item_scores(scores: List[float]) -> Tuple[int, int]:
+    """Count strong (>= 0.9) and partial (0.4-0.9) checklist matches."""
+    if len(scores) >= _VECTORIZE_MIN_ITEMS:
+        try:
+            import numpy as np
+        except ImportError:
+            pass
+        else:
+            arr = np.asarray(scores, dtype=np.float64)
+            hits = int(np.count_nonzero(arr >= 0.9))
+            return hits, int(np.count_nonzero(arr >= 0.4)) - hits
+    hits = sum(1 for s in scores if s >= 0.9)
+    partials = sum(1 for s in scores if 0.4 <= s < 0.9)
+    return hits, partials
+
+
+def _fsum_add(partials: List[float], x: float) -> None:
+    """Add *x* to a running exact sum kept as non-overlapping *partials*.
+
+    Shewchuk's algorithm, as used by :func:`math.fsum`: ``math.fsum(partials)``
+    then equals ``math.fsum`` over every value added, while only a handful of
+    partials are held however many values go in.
+    """
+    i = 0
+    for y in partials:
+        if abs(x) < abs(y):
+            x, y = y, x
+        hi = x + y
+        lo = y - (hi - x)
+        if lo:
+            partials[i] = lo
+            i += 1
+        x = hi
+    partials[i:] = [x]
+
+
 class Evaluator:
     """Scores agent outputs by matching against expected.md checklist items."""
 
@@ -31,23 +142,30 @@ class Evaluator:
             with values ``{"accuracy": 0.85, ...}`` for precise manual evaluation.
         """
         self.manual_scores = manual_scores or {}
+        # agent -> (fingerprint, scorecard); see _scorecard_version
+        self._scorecards: Dict[str, Tuple[Tuple[Any, ...], AgentScorecard]] = {}
+
+    def reset(self) -> None:
+        """Drop cached agent scorecards."""
+        self._scorecards.clear()
 
     # ── Single task ───────────────────────────────────────────────────────
 
     def evaluate_task(self, result: BenchmarkResult) -> float:
         """Score a single task result (0-100)."""
-        key = f"{result.agent}/{result.domain}/task{result.task_id}"
-
         # Manual override takes priority
-        if key in self.manual_scores:
-            return float(self.manual_scores[key].get("score", 0))
+        if self.manual_scores:
+            key = f"{result.agent}/{result.domain}/task{result.task_id}"
+            if key in self.manual_scores:
+                return float(self.manual_scores[key].get("score", 0))
 
         if not result.completed:
             return 0.0
 
         # Pre-scored accuracy (set by runner or seed) takes priority
-        if result.metrics.accuracy > 0:
-            return round(result.metrics.accuracy * 100, 1)
+        accuracy = result.metrics.accuracy
+        if accuracy > 0:
+            return round(accuracy * 100, 1)
 
         # Load expected.md checklist for the domain
         checklist = self._load_checklist(result.domain, result.task_id)
@@ -55,14 +173,17 @@ class Evaluator:
         # Heuristic scoring against checklist
         heuristic_score = 0.0
         if checklist and result.output:
-            hits = 0
-            partials = 0
-            for item in checklist:
-                s = self._score_checklist_item(item, result.output)
-                if s >= 0.9:
-                    hits += 1
-                elif s >= 0.4:
-                    partials += 1
+            output_lower = result.output.lower()
+            # One automaton pass finds every keyword present in the output
+            automaton = _keyword_automaton(tuple(checklist))
+            found: Optional[Set[str]] = None
+            if automaton is not None:
+                found = {kw for _, kw in automaton.iter(output_lower)}
+            item_scores = [
+                self._score_checklist_item(keywords, output_lower, found)
+                for keywords in checklist
+            ]
+            hits, partials = _tally_item_scores(item_scores)
             total = len(checklist)
             if total > 0:
                 heuristic_score = ((hits * 1.0) + (partials * 0.5)) / total * 100
@@ -75,10 +196,16 @@ class Evaluator:
 
     # ── Domain level ──────────────────────────────────────────────────────
 
-    def evaluate_domain(self, agent: str, domain: str) -> DomainScore:
-        """Load all results for *agent/domain* and produce a DomainScore."""
-        results_dir = RESULTS_DIR / agent / domain
-        results = self._load_results(results_dir)
+    def evaluate_domain(
+        self, agent: str, domain: str, results: Optional[List[BenchmarkResult]] = None
+    ) -> DomainScore:
+        """Produce a DomainScore for *agent/domain*.
+
+        *results* may be passed in when already loaded; otherwise they are
+        read from the domain's results directory.
+        """
+        if results is None:
+            results = self._load_results(RESULTS_DIR / agent / domain)
 
         task_scores: Dict[int, float] = {}
         for r in results:
@@ -100,15 +227,29 @@ class Evaluator:
     # ── Agent level ───────────────────────────────────────────────────────
 
     def evaluate_agent(self, agent: str) -> AgentScorecard:
+        """Score *agent*, reusing the cached scorecard while its inputs are unchanged."""
+        version = self._scorecard_version(agent)
+        cached = self._scorecards.get(agent)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        card = self._evaluate_agent(agent)
+        self._scorecards[agent] = (version, card)
+        return card
+
+    def _evaluate_agent(self, agent: str) -> AgentScorecard:
+        # One directory walk feeds both scoring and the metrics summary
+        results_by_domain = self._load_all_for_agent(agent)
+
         domain_scores: Dict[str, DomainScore] = {}
         for d in DOMAINS:
-            domain_scores[d] = self.evaluate_domain(agent, d)
+            domain_scores[d] = self.evaluate_domain(agent, d, results_by_domain.get(d, []))
 
         scores = [ds.aggregate for ds in domain_scores.values() if ds.task_scores]
         overall = sum(scores) / max(len(scores), 1)
 
-        # Aggregate metrics from results
-        metrics_summary = self._aggregate_metrics(agent)
+        # Aggregate metrics from the already-loaded results
+        all_results = [r for rs in results_by_domain.values() for r in rs]
+        metrics_summary = self._aggregate_metrics(agent, all_results)
 
         return AgentScorecard(
             agent_name=agent,
@@ -119,45 +260,66 @@ class Evaluator:
 
     # ── Compare all agents ────────────────────────────────────────────────
 
-    def compare_agents(self, agents: Optional[List[str]] = None) -> Dict[str, AgentScorecard]:
+    def compare_agents(
+        self, agents: Optional[List[str]] = None, max_workers: Optional[int] = 1
+    ) -> Dict[str, AgentScorecard]:
+        """Evaluate agents, serially in-process by default.
+
+        Scoring is light file parsing, so a process pool usually costs more
+        to start than it saves. ``max_workers`` > 1 (or None for one worker
+        per CPU) evaluates stale agents in worker processes instead.
+        """
         agents = agents or ALL_AGENTS
-        return {a: self.evaluate_agent(a) for a in agents}
+        if max_workers == 1 or len(agents) < 2:
+            return {a: self.evaluate_agent(a) for a in agents}
+
+        versions = {a: self._scorecard_version(a) for a in agents}
+        stale = [
+            a for a in agents
+            if a not in self._scorecards or self._scorecards[a][0] != versions[a]
+        ]
+        if len(stale) > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as ex:
+                for a, card in zip(stale, ex.map(self._evaluate_agent, stale)):
+                    self._scorecards[a] = (versions[a], card)
+        elif stale:
+            self._scorecards[stale[0]] = (versions[stale[0]], self._evaluate_agent(stale[0]))
+        return {a: self._scorecards[a][1] for a in agents}
 
     # ── Internal helpers ──────────────────────────────────────────────────
 
     @staticmethod
-    def _load_checklist(domain: str, task_id: int) -> List[str]:
-        """Parse ``- [ ]`` items from the relevant task section in expected.md."""
-        expected_path = BENCHMARKS_DIR / domain / "expected.md"
-        if not expected_path.exists():
-            return []
-
-        text = expected_path.read_text()
+    def _load_checklist(domain: str, task_id: int) -> List[Tuple[str, ...]]:
+        """Parse ``- [ ]`` items from the relevant task section in expected.md.
 
-        # Find the section for this task
-        pattern = rf"## Task {task_id}:.*?(?=\n## Task \d+:|\Z)"
-        match = re.search(pattern, text, re.DOTALL)
-        if not match:
+        Each item is returned pre-tokenized as its lowercased keywords.
+        """
+        expected_path = BENCHMARKS_DIR / domain / "expected.md"
+        try:
+            mtime = expected_path.stat().st_mtime
+        except OSError:
             return []
-
-        section = match.group(0)
-        items = re.findall(r"-\s*\[ ?\]\s*(.+)", section)
-        return items
+        return list(_checklist_items(domain, task_id, mtime))
 
     @staticmethod
-    def _score_checklist_item(item: str, output: str) -> float:
-        """Heuristic match of a checklist description against agent output.
+    def _score_checklist_item(
+        keywords: Sequence[str], output_lower: str, found: Optional[Set[str]] = None
+    ) -> float:
+        """Heuristic match of a checklist item's keywords against agent output.
+
+        *output_lower* is the already-lowercased output. *found*, when given,
+        is the set of keywords known to occur in it (from the automaton scan)
+        and replaces per-keyword searches.
 
         Returns 1.0 (strong match), 0.5 (partial), or 0.0 (no match).
         """
-        output_lower = output.lower()
-
-        # Extract meaningful keywords from checklist item (3+ char words)
-        keywords = [w.lower() for w in re.findall(r"[a-zA-Z]{3,}", item)]
         if not keywords:
             return 0.5
 
-        matched = sum(1 for kw in keywords if kw in output_lower)
+        if found is not None:
+            matched = sum(1 for kw in keywords if kw in found)
+        else:
+            matched = sum(1 for kw in keywords if kw in output_lower)
         ratio = matched / len(keywords)
 
         if ratio >= 0.6:
@@ -166,47 +328,118 @@ class Evaluator:
             return 0.5
         return 0.0
 
+    @classmethod
+    def _scorecard_version(cls, agent: str) -> Tuple[Any, ...]:
+        """Fingerprint of everything a scorecard depends on.
+
+        Covers the agent's results and each domain's expected.md/task.md, so
+        rubric edits invalidate cached scorecards too.
+        """
+        rubric = []
+        for d in DOMAINS:
+            for name in ("expected.md", "task.md"):
+                try:
+                    rubric.append((BENCHMARKS_DIR / d / name).stat().st_mtime_ns)
+                except OSError:
+                    rubric.append(0)
+        return cls._results_version(agent), tuple(rubric)
+
+    @staticmethod
+    def _results_version(agent: str) -> Tuple[int, int]:
+        """Cheap fingerprint of an agent's results: (file count, newest mtime_ns).
+
+        Only stats files, so a cache hit skips all YAML parsing.
+        """
+        agent_dir = RESULTS_DIR / agent
+        count = 0
+        newest = 0
+        for root, _dirs, files in os.walk(agent_dir):
+            for name in files:
+                count += 1
+                newest = max(newest, os.stat(os.path.join(root, name)).st_mtime_ns)
+        return count, newest
+
     @staticmethod
     def _load_results(results_dir: Path) -> List[BenchmarkResult]:
-        if not results_dir.exists():
-            return []
         results = []
-        for p in sorted(results_dir.glob("*.yaml")):
+        for p in _yaml_files(results_dir):
             try:
-                results.append(BenchmarkResult.load(p))
+                results.append(BenchmarkResult.load(Path(p)))
             except Exception:
                 continue
         return results
 
-    def _aggregate_metrics(self, agent: str) -> Dict[str, Any]:
-        """Summarise latency, tokens, resume rate, etc."""
+    @staticmethod
+    def _iter_metrics(agent_dir: Path) -> Iterator[TaskMetrics]:
+        """Yield metrics for every result under *agent_dir*, preferring the index."""
+        indexed = load_metrics_index(agent_dir)
+        if indexed is not None:
+            yield from indexed
+            return
+        for root, _dirs, files in os.walk(agent_dir):
+            for name in files:
+                if not name.endswith(".yaml"):
+                    continue
+                try:
+                    yield BenchmarkResult.load(Path(root, name)).metrics
+                except Exception:
+                    continue
+
+    @staticmethod
+    def _load_all_for_agent(agent: str) -> Dict[str, List[BenchmarkResult]]:
+        """Load every result for *agent* in one pass, grouped by domain directory."""
         agent_dir = RESULTS_DIR / agent
+        grouped: Dict[str, List[BenchmarkResult]] = {}
         if not agent_dir.exists():
-            return {}
-
-        latencies: List[float] = []
-        tokens: List[int] = []
+            return grouped
+        with os.scandir(agent_dir) as it:
+            domain_dirs = sorted((e.name, e.path) for e in it if e.is_dir())
+        for domain, path in domain_dirs:
+            for p in _yaml_files(Path(path)):
+                try:
+                    r = BenchmarkResult.load(Path(p))
+                except Exception:
+                    continue
+                grouped.setdefault(domain, []).append(r)
+        return grouped
+
+    def _aggregate_metrics(
+        self, agent: str, results: Optional[List[BenchmarkResult]] = None
+    ) -> Dict[str, Any]:
+        """Summarise latency, tokens, resume rate, etc.
+
+        Uses *results* when given, otherwise the agent's metrics index.
+        """
+        if results is not None:
+            if not results:
+                return {}
+            metrics_iter: Iterable[TaskMetrics] = (r.metrics for r in results)
+        else:
+            agent_dir = RESULTS_DIR / agent
+            if not agent_dir.exists():
+                return {}
+            metrics_iter = self._iter_metrics(agent_dir)
+
+        # Exact running sum, so the average doesn't depend on result order
+        lat_partials: List[float] = []
+        tok_sum = 0
         resumes = 0
         model_switches = 0
         total = 0
 
-        for p in agent_dir.rglob("*.yaml"):
-            try:
-                r = BenchmarkResult.load(p)
-            except Exception:
-                continue
+        for m in metrics_iter:
             total += 1
-            latencies.append(r.metrics.latency_seconds)
-            tokens.append(r.metrics.tokens_used)
-            if r.metrics.resume_success:
+            _fsum_add(lat_partials, m.latency_seconds)
+            tok_sum += m.tokens_used
+            if m.resume_success:
                 resumes += 1
-            if r.metrics.model_switch_success:
+            if m.model_switch_success:
                 model_switches += 1
 
         return {
-            "avg_latency_s": round(sum(latencies) / max(len(latencies), 1), 2),
-            "total_tokens": sum(tokens),
-            "avg_tokens": round(sum(tokens) / max(len(tokens), 1)),
+            "avg_latency_s": round(math.fsum(lat_partials) / max(total, 1), 2),
+            "total_tokens": tok_sum,
+            "avg_tokens": round(tok_sum / max(total, 1)),
             "resume_rate": round(resumes / max(total, 1), 2),
             "model_switch_rate": round(model_switches / max(total, 1), 2),
             "tasks_completed": total,
@@ -216,18 +449,36 @@ class Evaluator:
 # ── CLI entry-point ──────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
-    import argparse, json
+    import argparse, json, sys
 
     parser = argparse.ArgumentParser(description="GeekCode Benchmark Evaluator")
     parser.add_argument("--agent", help="Evaluate a single agent")
+    parser.add_argument("--format", choices=["yaml", "json"], default="yaml", help="Output format")
     args = parser.parse_args()
 
+    def emit(data: dict) -> None:
+        if args.format == "json":
+            try:
+                import orjson
+            except ImportError:
+                print(json.dumps(data, indent=2))
+            else:
+                opts = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+                sys.stdout.flush()
+                sys.stdout.buffer.write(orjson.dumps(data, option=opts))
+                sys.stdout.buffer.flush()
+        else:
+            print(yaml.dump(data, Dumper=YamlDumper, default_flow_style=False))
+
     evaluator = Evaluator()
     if args.agent:
-        card = evaluator.evaluate_agent(args.agent)
-        print(yaml.dump(card.to_dict(), default_flow_style=False))
+        emit(evaluator.evaluate_agent(args.agent).to_dict())
     else:
         cards = evaluator.compare_agents()
-        for name, card in cards.items():
-            print(f"\n{'='*50}")
-            print(yaml.dump(card.to_dict(), default_flow_style=False))
+        if args.format == "json":
+            # One document keyed by agent, so the output stays parseable
+            emit({name: card.to_dict() for name, card in cards.items()})
+        else:
+            for name, card in cards.items():
+                print(f"\n{'='*50}")
+                emit(card.to_dict())
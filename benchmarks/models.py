@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import json
+import os
 import re
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 import yaml
 
+# Re-exported for the rest of the benchmark pipeline
+from geekcode.utils.yaml_io import YamlDumper, YamlLoader  # noqa: F401
+
 # ── Constants ────────────────────────────────────────────────────────────────
 
 DOMAINS = ["coding", "finance", "healthcare", "general"]
@@ -38,6 +44,9 @@ AGENTS = ALL_AGENTS
 BENCHMARKS_DIR = Path(__file__).resolve().parent
 RESULTS_DIR = BENCHMARKS_DIR / "results"
 
+# Per-agent JSON-lines sidecar of result metrics, appended on every save
+METRICS_INDEX = "index.jsonl"
+
 # 20 named tasks per domain
 TASK_NAMES: Dict[str, List[str]] = {
     "coding": [
@@ -160,8 +169,11 @@ RUBRIC_WEIGHTS: Dict[str, Dict[str, float]] = {
 
 # ── Dataclasses ──────────────────────────────────────────────────────────────
 
+# __slots__ storage (no per-instance __dict__) where dataclasses support it (3.10+)
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class TaskInput:
     """Parsed task definition from a domain task.md file."""
 
@@ -205,7 +217,7 @@ class TaskInput:
         return tasks
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TaskMetrics:
     """Raw metrics collected for a single task run."""
 
@@ -237,7 +249,11 @@ class TaskMetrics:
         return cls(**{k: v for k, v in d.items() if k in cls.__dataclass_fields__})
 
 
-@dataclass
+# Seeded batches share one timestamp, so it repeats as often as the labels
+_INTERNED_FIELDS = ("timestamp", "agent", "domain", "scenario", "model")
+
+
+@dataclass(**_SLOTS)
 class BenchmarkResult:
     """Result of a single benchmark task execution."""
 
@@ -253,6 +269,9 @@ class BenchmarkResult:
     error: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
+        output = self.output
+        if len(output) > 2000:
+            output = output[:2000]  # truncate for YAML
         return {
             "timestamp": self.timestamp,
             "agent": self.agent,
@@ -260,7 +279,7 @@ class BenchmarkResult:
             "task_id": self.task_id,
             "scenario": self.scenario,
             "model": self.model,
-            "output": self.output[:2000],  # truncate for YAML
+            "output": output,
             "metrics": self.metrics.to_dict(),
             "completed": self.completed,
             "error": self.error,
@@ -269,25 +288,156 @@ class BenchmarkResult:
     @classmethod
     def from_dict(cls, d: Dict[str, Any]) -> "BenchmarkResult":
         metrics = TaskMetrics.from_dict(d.pop("metrics", {}))
-        return cls(metrics=metrics, **{k: v for k, v in d.items() if k in cls.__dataclass_fields__})
+        fields = {k: v for k, v in d.items() if k in cls.__dataclass_fields__}
+        # Low-cardinality labels repeat across thousands of results; share one copy
+        for k in _INTERNED_FIELDS:
+            if isinstance(fields.get(k), str):
+                fields[k] = sys.intern(fields[k])
+        return cls(metrics=metrics, **fields)
 
     def save(self, base_dir: Optional[Path] = None) -> Path:
         """Save result as YAML."""
         base = base_dir or RESULTS_DIR
         out_dir = base / self.agent / self.domain
         out_dir.mkdir(parents=True, exist_ok=True)
+        path = self._write(out_dir)
+        with open(base / self.agent / METRICS_INDEX, "a") as f:
+            f.write(self._index_line(path))
+        return path
+
+    @staticmethod
+    def save_many(results: Iterable["BenchmarkResult"], base_dir: Optional[Path] = None) -> List[Path]:
+        """Save several results, appending each agent's index entries in one write."""
+        base = base_dir or RESULTS_DIR
+        paths: List[Path] = []
+        index_lines: Dict[str, List[str]] = {}
+        created: Set[Path] = set()
+        for r in results:
+            out_dir = base / r.agent / r.domain
+            if out_dir not in created:
+                out_dir.mkdir(parents=True, exist_ok=True)
+                created.add(out_dir)
+            path = r._write(out_dir)
+            index_lines.setdefault(r.agent, []).append(r._index_line(path))
+            paths.append(path)
+        for agent, lines in index_lines.items():
+            with open(base / agent / METRICS_INDEX, "a") as f:
+                f.write("".join(lines))
+        return paths
+
+    def _write(self, out_dir: Path) -> Path:
         path = out_dir / f"{self.scenario}_task{self.task_id}.yaml"
         with open(path, "w") as f:
-            yaml.dump(self.to_dict(), f, default_flow_style=False, sort_keys=False)
+            yaml.dump(self.to_dict(), f, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
         return path
 
+    def _index_line(self, path: Path) -> str:
+        entry = {
+            "file": f"{self.domain}/{path.name}",
+            "metrics": self.metrics.to_dict(),
+        }
+        return json.dumps(entry) + "\n"
+
     @classmethod
     def load(cls, path: Path) -> "BenchmarkResult":
         with open(path) as f:
-            return cls.from_dict(yaml.safe_load(f))
-
-
-@dataclass
+            return cls.from_dict(yaml.load(f, Loader=YamlLoader))
+
+
+def load_metrics_index(agent_dir: Path) -> Optional[List[TaskMetrics]]:
+    """Read the metrics sidecar for one agent directory.
+
+    Returns None when no index exists (results written before the index was
+    introduced); callers should fall back to parsing the YAML files. Later
+    entries for the same result file replace earlier ones.
+    """
+    by_file = load_metrics_index_by_file(agent_dir)
+    return None if by_file is None else list(by_file.values())
+
+
+def load_metrics_index_by_file(agent_dir: Path) -> Optional[Dict[str, TaskMetrics]]:
+    """Like :func:`load_metrics_index`, keyed by ``"<domain>/<file name>"``.
+
+    The index is only appended to, so it is checked against the result files
+    on every read: if files were added, removed or modified without
+    :meth:`BenchmarkResult.save`, or re-saves left duplicate entries, it is
+    rebuilt from the YAML files. Files that could not be parsed keep an
+    ``"error"`` entry, so they don't trigger a rebuild on every read, and are
+    left out of the result.
+    """
+    index_path = agent_dir / METRICS_INDEX
+    try:
+        index_mtime = index_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    files = _result_file_mtimes(agent_dir)
+
+    # None marks a result file recorded as unreadable
+    latest: Dict[str, Optional[Dict[str, Any]]] = {}
+    lines = 0
+    with open(index_path) as f:
+        for line in f:
+            lines += 1
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            latest[entry.get("file", "")] = None if entry.get("error") else entry.get("metrics", {})
+
+    stale = latest.keys() != files.keys() or max(files.values(), default=0) > index_mtime
+    if stale:
+        return rebuild_metrics_index(agent_dir)
+    if lines > len(latest):
+        _write_metrics_index(agent_dir, latest)
+    return {name: TaskMetrics.from_dict(m) for name, m in latest.items() if m is not None}
+
+
+def rebuild_metrics_index(agent_dir: Path) -> Dict[str, TaskMetrics]:
+    """Regenerate an agent's metrics index from its result YAML files."""
+    metrics: Dict[str, TaskMetrics] = {}
+    entries: Dict[str, Optional[Dict[str, Any]]] = {}
+    for name in sorted(_result_file_mtimes(agent_dir)):
+        try:
+            metrics[name] = BenchmarkResult.load(agent_dir / name).metrics
+        except Exception:
+            entries[name] = None
+            continue
+        entries[name] = metrics[name].to_dict()
+    _write_metrics_index(agent_dir, entries)
+    return metrics
+
+
+def _result_file_mtimes(agent_dir: Path) -> Dict[str, int]:
+    """``"<domain>/<file name>"`` -> mtime_ns for every result YAML of an agent."""
+    mtimes: Dict[str, int] = {}
+    with os.scandir(agent_dir) as domains:
+        for domain in domains:
+            if not domain.is_dir():
+                continue
+            with os.scandir(domain.path) as it:
+                for entry in it:
+                    if entry.name.endswith(".yaml"):
+                        mtimes[f"{domain.name}/{entry.name}"] = entry.stat().st_mtime_ns
+    return mtimes
+
+
+def _write_metrics_index(agent_dir: Path, metrics: Dict[str, Optional[Dict[str, Any]]]) -> None:
+    """Replace an agent's index with one entry per result file.
+
+    A metrics value of None is written as an ``"error"`` entry.
+    """
+    index_path = agent_dir / METRICS_INDEX
+    tmp = index_path.with_name(METRICS_INDEX + ".tmp")
+    with open(tmp, "w") as f:
+        f.writelines(
+            json.dumps({"file": name, "error": True} if m is None else {"file": name, "metrics": m})
+            + "\n"
+            for name, m in metrics.items()
+        )
+    os.replace(tmp, index_path)
+
+
+@dataclass(**_SLOTS)
 class DomainScore:
     """Scored result for one agent in one domain."""
 
@@ -297,7 +447,7 @@ class DomainScore:
     aggregate: float = 0.0  # weighted 0-100
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AgentScorecard:
     """Complete scorecard for one agent across all domains."""
 
@@ -2,11 +2,25 @@
 
 from __future__ import annotations
 
+import io
 import math
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
-
-from benchmarks.models import ALL_AGENTS, DOMAIN_AGENTS, DOMAIN_LABELS, DOMAINS, TASK_NAMES, AgentScorecard
+from typing import Dict, FrozenSet, List, Optional, Set, TextIO, Tuple, Union
+
+from benchmarks.models import (
+    ALL_AGENTS,
+    DOMAIN_AGENTS,
+    DOMAIN_LABELS,
+    DOMAINS,
+    RESULTS_DIR,
+    TASK_NAMES,
+    AgentScorecard,
+    BenchmarkResult,
+    TaskMetrics,
+    load_metrics_index_by_file,
+)
 
 # ── Colour palette per agent ────────────────────────────────────────────────
 
@@ -30,12 +44,149 @@ AGENT_LABELS: Dict[str, str] = {
     "gemini_cli": "Gemini CLI",
 }
 
+# ── Feature support per agent ───────────────────────────────────────────────
+
+FEATURES: Dict[str, FrozenSet[str]] = {
+    "Filesystem State":      frozenset({"geekcode"}),
+    "Resume After Close":    frozenset({"geekcode"}),
+    "Token Caching":         frozenset({"geekcode"}),
+    "Model Switching":       frozenset({"geekcode"}),
+    "Workspace Queries":     frozenset({"geekcode", "claude_code"}),
+    "Multi-Domain":          frozenset({"geekcode", "chatgpt_cli", "gemini_cli", "perplexity"}),
+    "Open Source":           frozenset({"geekcode", "aider", "codex_cli"}),
+    "Local Models (Ollama)": frozenset({"geekcode", "aider"}),
+    "Edit-Test Loop":        frozenset({"geekcode", "claude_code", "codex_cli", "aider"}),
+    "MCPorter (lean MCP)":   frozenset({"geekcode"}),
+}
+
+
+# ── SVG formatting helpers ─────────────────────────────────────────────────
+
+def _fmt(x: float) -> str:
+    """Format an SVG coordinate to one decimal, dropping a trailing ``.0``."""
+    s = f"{x:.1f}"
+    if s.endswith(".0"):
+        s = s[:-2]
+    return "0" if s == "-0" else s
+
+
+def _rgba(colour: str, alpha: float) -> str:
+    """``#rgb``/``#rrggbb`` plus opacity as a single ``rgba()`` fill value."""
+    h = colour.lstrip("#")
+    if len(h) == 3:
+        h = "".join(c * 2 for c in h)
+    r, g, b = (int(h[i:i + 2], 16) for i in (0, 2, 4))
+    return f"rgba({r},{g},{b},{alpha:g})"
+
+
+_VECTORIZE_MIN_POINTS = 256
+
+
+def _radar_vertices(
+    cx: float,
+    cy: float,
+    radius: float,
+    units: List[Tuple[float, float]],
+    scores: List[List[float]],
+) -> List[List[Tuple[float, float]]]:
+    """Polygon vertices per agent; *scores* are 0-1 fractions, one per axis."""
+    if len(scores) * len(units) >= _VECTORIZE_MIN_POINTS:
+        try:
+            import numpy as np
+        except ImportError:
+            pass
+        else:
+            u = np.asarray(units, dtype=np.float64)
+            r = radius * np.asarray(scores, dtype=np.float64)
+            xs, ys = cx + r * u[:, 0], cy + r * u[:, 1]
+            return [list(zip(x, y)) for x, y in zip(xs.tolist(), ys.tolist())]
+    return [
+        [(cx + radius * s * ux, cy + radius * s * uy) for s, (ux, uy) in zip(row, units)]
+        for row in scores
+    ]
+
+
+@lru_cache(maxsize=16)
+def _y_grid(x0: int, x1: int, margin_t: int, chart_h: int) -> str:
+    """0-100 gridlines (as one <path>) and tick labels for a vertical bar chart."""
+    ticks = [(tick, margin_t + chart_h - (tick / 100) * chart_h) for tick in range(0, 101, 20)]
+    d = " ".join(f"M{x0},{y:.0f} H{x1}" for _, y in ticks)
+    labels = "".join(
+        f'<text x="{x0 - 8}" y="{y + 4:.0f}" text-anchor="end" font-size="11" fill="#94a3b8">{tick}</text>\n'
+        for tick, y in ticks
+    )
+    return f'<path d="{d}" stroke="#e2e8f0" stroke-width="1"/>\n' + labels
+
+
+def _subdirs(path: Union[str, Path]) -> List[str]:
+    """Paths of the immediate subdirectories of *path* (empty if it doesn't exist)."""
+    try:
+        with os.scandir(path) as it:
+            return [e.path for e in it if e.is_dir()]
+    except OSError:
+        return []
+
 
 class ReportGenerator:
     """Produce markdown tables and SVG charts from agent scorecards."""
 
     def __init__(self, scorecards: Dict[str, AgentScorecard]):
         self.scorecards = scorecards
+        # Per-agent domain aggregates (None where the agent has no scores)
+        # and the set of domains each agent competes in, computed once.
+        self._agg: Dict[str, Dict[str, Optional[float]]] = {
+            agent: {d: (ds.aggregate if ds and ds.task_scores else None) for d, ds in card.domain_scores.items()}
+            for agent, card in scorecards.items()
+        }
+        self._competes: Dict[str, Set[str]] = {
+            agent: {d for d, v in agg.items() if v is not None} for agent, agg in self._agg.items()
+        }
+        # Per-agent (colour, label, closing fragment of a bar <rect>), built once
+        self._style: Dict[str, Tuple[str, str, str]] = {}
+        for agent in scorecards:
+            colour = AGENT_COLOURS.get(agent, "#888")
+            self._style[agent] = (colour, AGENT_LABELS.get(agent, agent), f' rx="4" fill="{colour}"/>\n')
+        self._metrics: Optional[Dict[Tuple[str, str], List[TaskMetrics]]] = None
+        # metric -> one value per agent (scorecard order), filled on first use
+        self._metric_columns: Dict[str, List[float]] = {}
+
+    def _metric_column(self, metric: str) -> List[float]:
+        """Values of *metric* for every agent, gathered once per metric."""
+        column = self._metric_columns.get(metric)
+        if column is None:
+            column = [card.metrics_summary.get(metric, 0) for card in self.scorecards.values()]
+            self._metric_columns[metric] = column
+        return column
+
+    def _load_domain_metrics(self) -> Dict[Tuple[str, str], List[TaskMetrics]]:
+        """Per-task metrics keyed by ``(agent, domain)``, loaded once.
+
+        Reads each agent's metrics index so result outputs are never parsed;
+        agents without an index fall back to loading their YAML files.
+        """
+        if self._metrics is None:
+            metrics: Dict[Tuple[str, str], List[TaskMetrics]] = {}
+            # Only averages are taken, so directory order doesn't matter
+            for agent_dir in _subdirs(RESULTS_DIR):
+                agent = os.path.basename(agent_dir)
+                indexed = load_metrics_index_by_file(Path(agent_dir))
+                if indexed is not None:
+                    for name, m in indexed.items():
+                        domain, _, _ = name.partition("/")
+                        metrics.setdefault((agent, domain), []).append(m)
+                    continue
+                for domain_dir in _subdirs(agent_dir):
+                    bucket = metrics.setdefault((agent, os.path.basename(domain_dir)), [])
+                    with os.scandir(domain_dir) as it:
+                        for entry in it:
+                            if not entry.name.endswith(".yaml"):
+                                continue
+                            try:
+                                bucket.append(BenchmarkResult.load(Path(entry.path)).metrics)
+                            except Exception:
+                                continue
+            self._metrics = metrics
+        return self._metrics
 
     # ── Markdown tables ───────────────────────────────────────────────────
 
@@ -46,9 +197,10 @@ class ReportGenerator:
         for agent, card in self.scorecards.items():
             label = AGENT_LABELS.get(agent, agent)
             cells = []
+            agg = self._agg[agent]
             for d in DOMAINS:
-                ds = card.domain_scores.get(d)
-                cells.append(f"{ds.aggregate:.0f}" if (ds and ds.task_scores) else "—")
+                v = agg.get(d)
+                cells.append(f"{v:.0f}" if v is not None else "—")
             cells.append(f"**{card.overall_score:.0f}**")
             rows.append(f"| {label} | " + " | ".join(cells) + " |")
         return "\n".join([header, sep] + rows)
@@ -60,7 +212,7 @@ class ReportGenerator:
         for agent, card in self.scorecards.items():
             m = card.metrics_summary
             label = AGENT_LABELS.get(agent, agent)
-            n_domains = sum(1 for d in DOMAINS if card.domain_scores.get(d) and card.domain_scores[d].task_scores)
+            n_domains = sum(1 for d in DOMAINS if d in self._competes[agent])
             n_tasks = m.get("tasks_completed", 0)
             rows.append(
                 f"| {label} "
@@ -76,25 +228,12 @@ class ReportGenerator:
     def feature_comparison_table(self) -> str:
         # Order: GeekCode first, then alphabetical
         agents = ["geekcode"] + [a for a in ALL_AGENTS if a != "geekcode"]
-        # Feature flags per agent
-        feature_map = {
-            "Filesystem State":    {"geekcode": True},
-            "Resume After Close":  {"geekcode": True},
-            "Token Caching":       {"geekcode": True},
-            "Model Switching":     {"geekcode": True},
-            "Workspace Queries":   {"geekcode": True, "claude_code": True},
-            "Multi-Domain":        {"geekcode": True, "chatgpt_cli": True, "gemini_cli": True, "perplexity": True},
-            "Open Source":         {"geekcode": True, "aider": True, "codex_cli": True},
-            "Local Models (Ollama)": {"geekcode": True, "aider": True},
-            "Edit-Test Loop":      {"geekcode": True, "claude_code": True, "codex_cli": True, "aider": True},
-            "MCPorter (lean MCP)": {"geekcode": True},
-        }
         agents_display = [AGENT_LABELS.get(a, a) for a in agents]
         header = "| Feature | " + " | ".join(agents_display) + " |"
         sep = "|---|" + "|".join(["---"] * len(agents)) + "|"
         rows = []
-        for name, flags in feature_map.items():
-            cells = ["✅" if flags.get(a, False) else "❌" for a in agents]
+        for name, supported in FEATURES.items():
+            cells = ["✅" if a in supported else "❌" for a in agents]
             rows.append(f"| {name} | " + " | ".join(cells) + " |")
         return "\n".join([header, sep] + rows)
 
@@ -102,56 +241,60 @@ class ReportGenerator:
 
     def radar_chart_svg(self, width: int = 660, height: int = 500) -> str:
         """4-axis spider/radar chart comparing agents across domains."""
+        out = io.StringIO()
+        self._write_radar_chart(out, width, height)
+        return out.getvalue()
+
+    def _write_radar_chart(self, out: TextIO, width: int = 660, height: int = 500) -> None:
         cx, cy = width / 2, height / 2
         radius = min(cx, cy) - 80
         n = len(DOMAINS)
-        angles = [2 * math.pi * i / n - math.pi / 2 for i in range(n)]
-
-        def polar(angle: float, r: float):
-            return cx + r * math.cos(angle), cy + r * math.sin(angle)
-
-        lines: List[str] = [
-            f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
-            f'width="{width}" height="{height}" style="font-family:system-ui,sans-serif;background:#fff">',
-            f'<text x="{cx}" y="28" text-anchor="middle" font-size="16" font-weight="bold" fill="#1a1a2e">Domain Score Comparison</text>',
-        ]
-
-        # Grid rings
+        cos, sin = math.cos, math.sin
+        # Unit vector per axis; a point at radius r is (cx + r*ux, cy + r*uy)
+        units = [(cos(a), sin(a)) for a in (2 * math.pi * i / n - math.pi / 2 for i in range(n))]
+
+        write = out.write
+        style = self._style
+        write(f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+              f'width="{width}" height="{height}" style="font-family:system-ui,sans-serif;background:#fff">\n')
+        write(f'<text x="{_fmt(cx)}" y="28" text-anchor="middle" font-size="16" font-weight="bold" fill="#1a1a2e">Domain Score Comparison</text>\n')
+
+        # Grid rings — one <path> with a closed subpath per ring
+        rings = []
         for level in (0.25, 0.50, 0.75, 1.0):
             r = radius * level
-            pts = " ".join(f"{polar(a, r)[0]:.1f},{polar(a, r)[1]:.1f}" for a in angles)
-            lines.append(f'<polygon points="{pts}" fill="none" stroke="#e2e8f0" stroke-width="1"/>')
-            lx, ly = polar(angles[0], r)
-            lines.append(f'<text x="{lx + 4:.0f}" y="{ly - 4:.0f}" font-size="10" fill="#94a3b8">{int(level*100)}</text>')
+            rings.append("M" + " L".join(f"{_fmt(cx + r * ux)},{_fmt(cy + r * uy)}" for ux, uy in units) + " Z")
+        write(f'<path d="{" ".join(rings)}" fill="none" stroke="#e2e8f0" stroke-width="1"/>\n')
+        for level in (0.25, 0.50, 0.75, 1.0):
+            ux, uy = units[0]
+            lx, ly = cx + radius * level * ux, cy + radius * level * uy
+            write(f'<text x="{lx + 4:.0f}" y="{ly - 4:.0f}" font-size="10" fill="#94a3b8">{int(level*100)}</text>\n')
 
-        # Axis lines and labels
+        # Axis lines (one <path>) and labels
+        spokes = []
         for i, domain in enumerate(DOMAINS):
-            ex, ey = polar(angles[i], radius)
-            lines.append(f'<line x1="{cx}" y1="{cy}" x2="{ex:.1f}" y2="{ey:.1f}" stroke="#cbd5e1" stroke-width="1"/>')
-            lx, ly = polar(angles[i], radius + 22)
-            lines.append(f'<text x="{lx:.0f}" y="{ly:.0f}" text-anchor="middle" font-size="13" font-weight="600" fill="#334155">{DOMAIN_LABELS.get(domain, domain.title())}</text>')
+            ux, uy = units[i]
+            ex, ey = cx + radius * ux, cy + radius * uy
+            spokes.append(f"M{_fmt(cx)},{_fmt(cy)} L{_fmt(ex)},{_fmt(ey)}")
+        write(f'<path d="{" ".join(spokes)}" stroke="#cbd5e1" stroke-width="1"/>\n')
+        for i, domain in enumerate(DOMAINS):
+            ux, uy = units[i]
+            lx, ly = cx + (radius + 22) * ux, cy + (radius + 22) * uy
+            write(f'<text x="{lx:.0f}" y="{ly:.0f}" text-anchor="middle" font-size="13" font-weight="600" fill="#334155">{DOMAIN_LABELS.get(domain, domain.title())}</text>\n')
 
         # Agent polygons (skip agents with no scores in any domain)
-        for agent, card in self.scorecards.items():
-            colour = AGENT_COLOURS.get(agent, "#888")
-            has_any = any(
-                (card.domain_scores.get(d) and card.domain_scores[d].task_scores)
-                for d in DOMAINS
-            )
-            if not has_any:
-                continue
-            pts = []
-            for i, domain in enumerate(DOMAINS):
-                ds = card.domain_scores.get(domain)
-                score = (ds.aggregate / 100.0) if (ds and ds.task_scores) else 0
-                x, y = polar(angles[i], radius * score)
-                pts.append(f"{x:.1f},{y:.1f}")
-            pts_str = " ".join(pts)
-            lines.append(f'<polygon points="{pts_str}" fill="{colour}" fill-opacity="0.15" stroke="{colour}" stroke-width="2.5"/>')
-            # Dots on vertices
-            for pt in pts:
-                px, py = pt.split(",")
-                lines.append(f'<circle cx="{px}" cy="{py}" r="4" fill="{colour}"/>')
+        plotted = [a for a in self.scorecards if any(d in self._competes[a] for d in DOMAINS)]
+        scores = [
+            [(v / 100.0) if v is not None else 0 for v in map(self._agg[a].get, DOMAINS)]
+            for a in plotted
+        ]
+        for agent, vertices in zip(plotted, _radar_vertices(cx, cy, radius, units, scores)):
+            colour = style[agent][0]
+            pts = [f"{_fmt(x)},{_fmt(y)}" for x, y in vertices]
+            write(f'<path d="M{" L".join(pts)} Z" fill="{_rgba(colour, 0.15)}" stroke="{colour}" stroke-width="2.5"/>\n')
+            # Vertex dots as circular arc subpaths of a single <path>
+            dots = "".join(f"M{pt}m-4,0a4,4 0 1,0 8,0a4,4 0 1,0 -8,0" for pt in pts)
+            write(f'<path d="{dots}" fill="{colour}"/>\n')
 
         # Legend — evenly spaced across the full width
         ly = height - 40
@@ -159,20 +302,23 @@ class ReportGenerator:
         spacing = (width - 80) / max(n_agents, 1)
         lx_start = 40
         for i, agent in enumerate(self.scorecards):
-            colour = AGENT_COLOURS.get(agent, "#888")
-            label = AGENT_LABELS.get(agent, agent)
+            colour, label, _ = style[agent]
             x = lx_start + i * spacing
-            lines.append(f'<rect x="{x:.0f}" y="{ly}" width="14" height="14" rx="3" fill="{colour}"/>')
-            lines.append(f'<text x="{x + 20:.0f}" y="{ly + 12}" font-size="12" fill="#475569">{label}</text>')
+            write(f'<rect x="{x:.0f}" y="{ly}" width="14" height="14" rx="3" fill="{colour}"/>\n')
+            write(f'<text x="{x + 20:.0f}" y="{ly + 12}" font-size="12" fill="#475569">{label}</text>\n')
 
-        lines.append("</svg>")
-        return "\n".join(lines)
+        write("</svg>")
 
     def bar_chart_svg(self, width: int = 600, height: int = 340) -> str:
         """Grouped bar chart — overall scores per agent."""
+        out = io.StringIO()
+        self._write_bar_chart(out, width, height)
+        return out.getvalue()
+
+    def _write_bar_chart(self, out: TextIO, width: int = 600, height: int = 340) -> None:
         agents = list(self.scorecards.keys())
         if not agents:
-            return ""
+            return
 
         margin_l, margin_r, margin_t, margin_b = 60, 30, 50, 60
         chart_w = width - margin_l - margin_r
@@ -180,48 +326,46 @@ class ReportGenerator:
         bar_w = chart_w / max(len(agents), 1) * 0.6
         gap = chart_w / max(len(agents), 1)
 
-        lines: List[str] = [
-            f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
-            f'width="{width}" height="{height}" style="font-family:system-ui,sans-serif;background:#fff">',
-            f'<text x="{width/2}" y="28" text-anchor="middle" font-size="16" font-weight="bold" fill="#1a1a2e">Overall Benchmark Scores</text>',
-        ]
+        write = out.write
+        style = self._style
+        write(f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+              f'width="{width}" height="{height}" style="font-family:system-ui,sans-serif;background:#fff">\n')
+        write(f'<text x="{_fmt(width/2)}" y="28" text-anchor="middle" font-size="16" font-weight="bold" fill="#1a1a2e">Overall Benchmark Scores</text>\n')
 
         # Y axis grid
-        for tick in range(0, 101, 20):
-            y = margin_t + chart_h - (tick / 100) * chart_h
-            lines.append(f'<line x1="{margin_l}" y1="{y:.0f}" x2="{width - margin_r}" y2="{y:.0f}" stroke="#e2e8f0" stroke-width="1"/>')
-            lines.append(f'<text x="{margin_l - 8}" y="{y + 4:.0f}" text-anchor="end" font-size="11" fill="#94a3b8">{tick}</text>')
+        write(_y_grid(margin_l, width - margin_r, margin_t, chart_h))
 
         # Bars
         for i, agent in enumerate(agents):
             card = self.scorecards[agent]
             score = card.overall_score
-            colour = AGENT_COLOURS.get(agent, "#888")
-            label = AGENT_LABELS.get(agent, agent)
+            colour, label, rect_end = style[agent]
 
             x = margin_l + i * gap + (gap - bar_w) / 2
             bar_h = (score / 100) * chart_h
             y = margin_t + chart_h - bar_h
 
-            lines.append(f'<rect x="{x:.1f}" y="{y:.1f}" width="{bar_w:.1f}" height="{bar_h:.1f}" rx="4" fill="{colour}"/>')
+            write(f'<rect x="{_fmt(x)}" y="{_fmt(y)}" width="{_fmt(bar_w)}" height="{_fmt(bar_h)}"{rect_end}')
             # Score label above bar
-            lines.append(f'<text x="{x + bar_w/2:.1f}" y="{y - 6:.0f}" text-anchor="middle" font-size="13" font-weight="bold" fill="{colour}">{score:.0f}</text>')
+            write(f'<text x="{_fmt(x + bar_w/2)}" y="{y - 6:.0f}" text-anchor="middle" font-size="13" font-weight="bold" fill="{colour}">{score:.0f}</text>\n')
             # Agent name below bar
-            lines.append(f'<text x="{x + bar_w/2:.1f}" y="{margin_t + chart_h + 20:.0f}" text-anchor="middle" font-size="12" fill="#475569">{label}</text>')
+            write(f'<text x="{_fmt(x + bar_w/2)}" y="{margin_t + chart_h + 20:.0f}" text-anchor="middle" font-size="12" fill="#475569">{label}</text>\n')
 
-        lines.append("</svg>")
-        return "\n".join(lines)
+        write("</svg>")
 
     def metrics_bar_chart_svg(self, metric: str = "avg_latency_s", label: str = "Avg Latency (s)", width: int = 600, height: int = 300) -> str:
         """Single-metric horizontal bar chart."""
+        out = io.StringIO()
+        self._write_metrics_bar_chart(out, metric, label, width, height)
+        return out.getvalue()
+
+    def _write_metrics_bar_chart(self, out: TextIO, metric: str = "avg_latency_s", label: str = "Avg Latency (s)", width: int = 600, height: int = 300) -> None:
         agents = list(self.scorecards.keys())
         if not agents:
-            return ""
+            return
 
-        values = [self.scorecards[a].metrics_summary.get(metric, 0) for a in agents]
-        max_val = max(values) if values else 1
-        if max_val == 0:
-            max_val = 1
+        values = self._metric_column(metric)
+        max_val = max(values) or 1
 
         margin_l, margin_r, margin_t, margin_b = 120, 40, 50, 30
         chart_w = width - margin_l - margin_r
@@ -229,35 +373,38 @@ class ReportGenerator:
         bar_h = chart_h / max(len(agents), 1) * 0.65
         gap = chart_h / max(len(agents), 1)
 
-        lines: List[str] = [
-            f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
-            f'width="{width}" height="{height}" style="font-family:system-ui,sans-serif;background:#fff">',
-            f'<text x="{width/2}" y="28" text-anchor="middle" font-size="15" font-weight="bold" fill="#1a1a2e">{label}</text>',
-        ]
+        write = out.write
+        style = self._style
+        write(f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+              f'width="{width}" height="{height}" style="font-family:system-ui,sans-serif;background:#fff">\n')
+        write(f'<text x="{_fmt(width/2)}" y="28" text-anchor="middle" font-size="15" font-weight="bold" fill="#1a1a2e">{label}</text>\n')
 
         for i, agent in enumerate(agents):
-            colour = AGENT_COLOURS.get(agent, "#888")
-            display = AGENT_LABELS.get(agent, agent)
+            colour, display, rect_end = style[agent]
             val = values[i]
             y = margin_t + i * gap + (gap - bar_h) / 2
             w = (val / max_val) * chart_w
 
-            lines.append(f'<text x="{margin_l - 8}" y="{y + bar_h/2 + 4:.0f}" text-anchor="end" font-size="12" fill="#475569">{display}</text>')
-            lines.append(f'<rect x="{margin_l}" y="{y:.1f}" width="{w:.1f}" height="{bar_h:.1f}" rx="4" fill="{colour}"/>')
-            lines.append(f'<text x="{margin_l + w + 6:.0f}" y="{y + bar_h/2 + 4:.0f}" font-size="12" font-weight="bold" fill="{colour}">{val:,.1f}</text>')
+            write(f'<text x="{margin_l - 8}" y="{y + bar_h/2 + 4:.0f}" text-anchor="end" font-size="12" fill="#475569">{display}</text>\n')
+            write(f'<rect x="{margin_l}" y="{_fmt(y)}" width="{_fmt(w)}" height="{_fmt(bar_h)}"{rect_end}')
+            write(f'<text x="{margin_l + w + 6:.0f}" y="{y + bar_h/2 + 4:.0f}" font-size="12" font-weight="bold" fill="{colour}">{val:,.1f}</text>\n')
 
-        lines.append("</svg>")
-        return "\n".join(lines)
+        write("</svg>")
 
     def domain_bar_chart_svg(self, domain: str, width: int = 500, height: int = 300) -> str:
         """Bar chart for a single domain — only includes agents that compete in it."""
+        out = io.StringIO()
+        self._write_domain_bar_chart(out, domain, width, height)
+        return out.getvalue()
+
+    def _write_domain_bar_chart(self, out: TextIO, domain: str, width: int = 500, height: int = 300) -> None:
         agents_in_domain = []
-        for agent, card in self.scorecards.items():
-            ds = card.domain_scores.get(domain)
-            if ds and ds.task_scores:
-                agents_in_domain.append((agent, ds.aggregate))
+        for agent, agg in self._agg.items():
+            v = agg.get(domain)
+            if v is not None:
+                agents_in_domain.append((agent, v))
         if not agents_in_domain:
-            return ""
+            return
 
         margin_l, margin_r, margin_t, margin_b = 60, 30, 50, 60
         chart_w = width - margin_l - margin_r
@@ -266,52 +413,42 @@ class ReportGenerator:
         bar_w = chart_w / max(n, 1) * 0.6
         gap = chart_w / max(n, 1)
 
-        lines: List[str] = [
-            f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
-            f'width="{width}" height="{height}" style="font-family:system-ui,sans-serif;background:#fff">',
-            f'<text x="{width/2}" y="28" text-anchor="middle" font-size="15" font-weight="bold" fill="#1a1a2e">{DOMAIN_LABELS.get(domain, domain.title())} — Score Comparison</text>',
-        ]
+        write = out.write
+        style = self._style
+        write(f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+              f'width="{width}" height="{height}" style="font-family:system-ui,sans-serif;background:#fff">\n')
+        write(f'<text x="{_fmt(width/2)}" y="28" text-anchor="middle" font-size="15" font-weight="bold" fill="#1a1a2e">{DOMAIN_LABELS.get(domain, domain.title())} — Score Comparison</text>\n')
 
-        for tick in range(0, 101, 20):
-            y = margin_t + chart_h - (tick / 100) * chart_h
-            lines.append(f'<line x1="{margin_l}" y1="{y:.0f}" x2="{width - margin_r}" y2="{y:.0f}" stroke="#e2e8f0" stroke-width="1"/>')
-            lines.append(f'<text x="{margin_l - 8}" y="{y + 4:.0f}" text-anchor="end" font-size="11" fill="#94a3b8">{tick}</text>')
+        write(_y_grid(margin_l, width - margin_r, margin_t, chart_h))
 
         for i, (agent, score) in enumerate(agents_in_domain):
-            colour = AGENT_COLOURS.get(agent, "#888")
-            label = AGENT_LABELS.get(agent, agent)
+            colour, label, rect_end = style[agent]
             x = margin_l + i * gap + (gap - bar_w) / 2
             bar_h = (score / 100) * chart_h
             y = margin_t + chart_h - bar_h
-            lines.append(f'<rect x="{x:.1f}" y="{y:.1f}" width="{bar_w:.1f}" height="{bar_h:.1f}" rx="4" fill="{colour}"/>')
-            lines.append(f'<text x="{x + bar_w/2:.1f}" y="{y - 6:.0f}" text-anchor="middle" font-size="13" font-weight="bold" fill="{colour}">{score:.0f}</text>')
-            lines.append(f'<text x="{x + bar_w/2:.1f}" y="{margin_t + chart_h + 20:.0f}" text-anchor="middle" font-size="12" fill="#475569">{label}</text>')
+            write(f'<rect x="{_fmt(x)}" y="{_fmt(y)}" width="{_fmt(bar_w)}" height="{_fmt(bar_h)}"{rect_end}')
+            write(f'<text x="{_fmt(x + bar_w/2)}" y="{y - 6:.0f}" text-anchor="middle" font-size="13" font-weight="bold" fill="{colour}">{score:.0f}</text>\n')
+            write(f'<text x="{_fmt(x + bar_w/2)}" y="{margin_t + chart_h + 20:.0f}" text-anchor="middle" font-size="12" fill="#475569">{label}</text>\n')
 
-        lines.append("</svg>")
-        return "\n".join(lines)
+        write("</svg>")
 
     def domain_latency_chart_svg(self, domain: str, width: int = 500, height: int = 260) -> str:
         """Horizontal bar chart of avg latency for agents in a single domain."""
+        out = io.StringIO()
+        self._write_domain_latency_chart(out, domain, width, height)
+        return out.getvalue()
+
+    def _write_domain_latency_chart(self, out: TextIO, domain: str, width: int = 500, height: int = 260) -> None:
         agents_in = []
-        for agent, card in self.scorecards.items():
-            ds = card.domain_scores.get(domain)
-            if not (ds and ds.task_scores):
+        for agent in self.scorecards:
+            if domain not in self._competes[agent]:
                 continue
             # Compute per-domain latency from results
-            from benchmarks.models import RESULTS_DIR, BenchmarkResult
-            domain_dir = RESULTS_DIR / agent / domain
-            lats = []
-            if domain_dir.exists():
-                for p in sorted(domain_dir.glob("*.yaml")):
-                    try:
-                        r = BenchmarkResult.load(p)
-                        lats.append(r.metrics.latency_seconds)
-                    except Exception:
-                        continue
-            avg_lat = sum(lats) / max(len(lats), 1) if lats else 0
+            lats = [m.latency_seconds for m in self._load_domain_metrics().get((agent, domain), ())]
+            avg_lat = math.fsum(lats) / max(len(lats), 1) if lats else 0
             agents_in.append((agent, avg_lat))
         if not agents_in:
-            return ""
+            return
 
         max_val = max(v for _, v in agents_in) if agents_in else 1
         if max_val == 0:
@@ -324,43 +461,36 @@ class ReportGenerator:
         bar_h = chart_h / max(n, 1) * 0.65
         gap_h = chart_h / max(n, 1)
 
-        lines: List[str] = [
-            f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
-            f'width="{width}" height="{height}" style="font-family:system-ui,sans-serif;background:#fff">',
-            f'<text x="{width/2}" y="24" text-anchor="middle" font-size="14" font-weight="bold" fill="#1a1a2e">{DOMAIN_LABELS.get(domain, domain.title())} — Avg Latency (s)</text>',
-        ]
+        write = out.write
+        style = self._style
+        write(f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+              f'width="{width}" height="{height}" style="font-family:system-ui,sans-serif;background:#fff">\n')
+        write(f'<text x="{_fmt(width/2)}" y="24" text-anchor="middle" font-size="14" font-weight="bold" fill="#1a1a2e">{DOMAIN_LABELS.get(domain, domain.title())} — Avg Latency (s)</text>\n')
         for i, (agent, val) in enumerate(agents_in):
-            colour = AGENT_COLOURS.get(agent, "#888")
-            display = AGENT_LABELS.get(agent, agent)
+            colour, display, rect_end = style[agent]
             y = margin_t + i * gap_h + (gap_h - bar_h) / 2
             w = (val / max_val) * chart_w
-            lines.append(f'<text x="{margin_l - 8}" y="{y + bar_h/2 + 4:.0f}" text-anchor="end" font-size="12" fill="#475569">{display}</text>')
-            lines.append(f'<rect x="{margin_l}" y="{y:.1f}" width="{w:.1f}" height="{bar_h:.1f}" rx="4" fill="{colour}"/>')
-            lines.append(f'<text x="{margin_l + w + 6:.0f}" y="{y + bar_h/2 + 4:.0f}" font-size="12" font-weight="bold" fill="{colour}">{val:.1f}s</text>')
-        lines.append("</svg>")
-        return "\n".join(lines)
+            write(f'<text x="{margin_l - 8}" y="{y + bar_h/2 + 4:.0f}" text-anchor="end" font-size="12" fill="#475569">{display}</text>\n')
+            write(f'<rect x="{margin_l}" y="{_fmt(y)}" width="{_fmt(w)}" height="{_fmt(bar_h)}"{rect_end}')
+            write(f'<text x="{margin_l + w + 6:.0f}" y="{y + bar_h/2 + 4:.0f}" font-size="12" font-weight="bold" fill="{colour}">{val:.1f}s</text>\n')
+        write("</svg>")
 
     def domain_tokens_chart_svg(self, domain: str, width: int = 500, height: int = 260) -> str:
         """Horizontal bar chart of avg tokens/task for agents in a single domain."""
+        out = io.StringIO()
+        self._write_domain_tokens_chart(out, domain, width, height)
+        return out.getvalue()
+
+    def _write_domain_tokens_chart(self, out: TextIO, domain: str, width: int = 500, height: int = 260) -> None:
         agents_in = []
-        for agent, card in self.scorecards.items():
-            ds = card.domain_scores.get(domain)
-            if not (ds and ds.task_scores):
+        for agent in self.scorecards:
+            if domain not in self._competes[agent]:
                 continue
-            from benchmarks.models import RESULTS_DIR, BenchmarkResult
-            domain_dir = RESULTS_DIR / agent / domain
-            toks = []
-            if domain_dir.exists():
-                for p in sorted(domain_dir.glob("*.yaml")):
-                    try:
-                        r = BenchmarkResult.load(p)
-                        toks.append(r.metrics.tokens_used)
-                    except Exception:
-                        continue
+            toks = [m.tokens_used for m in self._load_domain_metrics().get((agent, domain), ())]
             avg_tok = sum(toks) / max(len(toks), 1) if toks else 0
             agents_in.append((agent, avg_tok))
         if not agents_in:
-            return ""
+            return
 
         max_val = max(v for _, v in agents_in) if agents_in else 1
         if max_val == 0:
@@ -373,74 +503,90 @@ class ReportGenerator:
         bar_h = chart_h / max(n, 1) * 0.65
         gap_h = chart_h / max(n, 1)
 
-        lines: List[str] = [
-            f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
-            f'width="{width}" height="{height}" style="font-family:system-ui,sans-serif;background:#fff">',
-            f'<text x="{width/2}" y="24" text-anchor="middle" font-size="14" font-weight="bold" fill="#1a1a2e">{DOMAIN_LABELS.get(domain, domain.title())} — Avg Tokens/Task</text>',
-        ]
+        write = out.write
+        style = self._style
+        write(f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+              f'width="{width}" height="{height}" style="font-family:system-ui,sans-serif;background:#fff">\n')
+        write(f'<text x="{_fmt(width/2)}" y="24" text-anchor="middle" font-size="14" font-weight="bold" fill="#1a1a2e">{DOMAIN_LABELS.get(domain, domain.title())} — Avg Tokens/Task</text>\n')
         for i, (agent, val) in enumerate(agents_in):
-            colour = AGENT_COLOURS.get(agent, "#888")
-            display = AGENT_LABELS.get(agent, agent)
+            colour, display, rect_end = style[agent]
             y = margin_t + i * gap_h + (gap_h - bar_h) / 2
             w = (val / max_val) * chart_w
-            lines.append(f'<text x="{margin_l - 8}" y="{y + bar_h/2 + 4:.0f}" text-anchor="end" font-size="12" fill="#475569">{display}</text>')
-            lines.append(f'<rect x="{margin_l}" y="{y:.1f}" width="{w:.1f}" height="{bar_h:.1f}" rx="4" fill="{colour}"/>')
-            lines.append(f'<text x="{margin_l + w + 6:.0f}" y="{y + bar_h/2 + 4:.0f}" font-size="12" font-weight="bold" fill="{colour}">{val:,.0f}</text>')
-        lines.append("</svg>")
-        return "\n".join(lines)
+            write(f'<text x="{margin_l - 8}" y="{y + bar_h/2 + 4:.0f}" text-anchor="end" font-size="12" fill="#475569">{display}</text>\n')
+            write(f'<rect x="{margin_l}" y="{_fmt(y)}" width="{_fmt(w)}" height="{_fmt(bar_h)}"{rect_end}')
+            write(f'<text x="{margin_l + w + 6:.0f}" y="{y + bar_h/2 + 4:.0f}" font-size="12" font-weight="bold" fill="{colour}">{val:,.0f}</text>\n')
+        write("</svg>")
 
     # ── File output ───────────────────────────────────────────────────────
 
+    def _has_competitors(self, domain: str) -> bool:
+        """Whether any scored agent competes in *domain*."""
+        return any(domain in competes for competes in self._competes.values())
+
     def save_svgs(self, out_dir: Path) -> None:
         out_dir.mkdir(parents=True, exist_ok=True)
-        (out_dir / "radar_chart.svg").write_text(self.radar_chart_svg())
+        # Charts stream straight into their files — no intermediate string
+        with (out_dir / "radar_chart.svg").open("w") as f:
+            self._write_radar_chart(f)
         # Domain-specific charts — fair comparison (only agents that compete)
         for domain in DOMAINS:
-            (out_dir / f"{domain}_scores.svg").write_text(self.domain_bar_chart_svg(domain))
-            (out_dir / f"{domain}_latency.svg").write_text(self.domain_latency_chart_svg(domain))
-            (out_dir / f"{domain}_tokens.svg").write_text(self.domain_tokens_chart_svg(domain))
+            if not self._has_competitors(domain):
+                # Nobody competes: drop stale charts rather than write empty files
+                for kind in ("scores", "latency", "tokens"):
+                    (out_dir / f"{domain}_{kind}.svg").unlink(missing_ok=True)
+                continue
+            with (out_dir / f"{domain}_scores.svg").open("w") as f:
+                self._write_domain_bar_chart(f, domain)
+            with (out_dir / f"{domain}_latency.svg").open("w") as f:
+                self._write_domain_latency_chart(f, domain)
+            with (out_dir / f"{domain}_tokens.svg").open("w") as f:
+                self._write_domain_tokens_chart(f, domain)
 
     def save_report(self, path: Path) -> None:
-        """Write a full markdown report."""
+        """Write a full markdown report, streaming each section to *path*."""
         path.parent.mkdir(parents=True, exist_ok=True)
-        sections = [
-            "# GeekCode Benchmark Report\n",
-            f"_Auto-generated comparison of {len(self.scorecards)} agents across {len(DOMAINS)} domains._\n",
-            "## Overall Scores\n",
-            self.overall_comparison_table(),
-            "\n## Domain Comparison (Radar)\n",
-            "![Radar Chart](radar_chart.svg)\n",
-            "## Metrics Summary\n",
-            self.metrics_summary_table(),
-            "\n## Feature Comparison\n",
-            self.feature_comparison_table(),
-            "\n---\n",
-            "_Run benchmarks yourself: `geekcode` → `/benchmark run` → `/benchmark report`_\n",
-        ]
-
-        # Per-domain breakdowns with charts
-        sections.append("\n## Per-Domain Breakdown\n")
-        for domain in DOMAINS:
-            sections.append(f"\n### {DOMAIN_LABELS.get(domain, domain.title())}\n")
-            sections.append(f"![{DOMAIN_LABELS.get(domain, domain.title())} Scores]({domain}_scores.svg)\n")
-            task_names = TASK_NAMES.get(domain, [f"Task {i+1}" for i in range(20)])
-            n_tasks = len(task_names)
-            header = "| Agent | " + " | ".join(task_names) + " | Avg |"
-            sep = "|---|" + "|".join(["---"] * (n_tasks + 1)) + "|"
-            rows = []
-            for agent, card in self.scorecards.items():
-                label = AGENT_LABELS.get(agent, agent)
-                ds = card.domain_scores.get(domain)
-                if not ds or not ds.task_scores:
-                    continue
-                cells = [f"{ds.task_scores.get(i+1, 0):.0f}" for i in range(n_tasks)]
-                cells.append(f"**{ds.aggregate:.0f}**")
-                rows.append(f"| {label} | " + " | ".join(cells) + " |")
-            sections.extend([header, sep] + rows)
-            sections.append(f"\n![{DOMAIN_LABELS.get(domain, domain.title())} Latency]({domain}_latency.svg)")
-            sections.append(f"![{DOMAIN_LABELS.get(domain, domain.title())} Tokens]({domain}_tokens.svg)\n")
-
-        path.write_text("\n".join(sections))
+        with path.open("w") as f:
+            write = f.write
+            for chunk in (
+                "# GeekCode Benchmark Report\n",
+                f"_Auto-generated comparison of {len(self.scorecards)} agents across {len(DOMAINS)} domains._\n",
+                "## Overall Scores\n",
+                self.overall_comparison_table(),
+                "\n## Domain Comparison (Radar)\n",
+                "![Radar Chart](radar_chart.svg)\n",
+                "## Metrics Summary\n",
+                self.metrics_summary_table(),
+                "\n## Feature Comparison\n",
+                self.feature_comparison_table(),
+                "\n---\n",
+                "_Run benchmarks yourself: `geekcode` → `/benchmark run` → `/benchmark report`_\n",
+            ):
+                write(chunk)
+                write("\n")
+
+            # Per-domain breakdowns with charts
+            write("\n## Per-Domain Breakdown\n")
+            for domain in DOMAINS:
+                if not self._has_competitors(domain):
+                    continue  # save_svgs writes no charts for it either
+                domain_label = DOMAIN_LABELS.get(domain, domain.title())
+                write(f"\n\n### {domain_label}\n\n")
+                write(f"![{domain_label} Scores]({domain}_scores.svg)\n\n")
+                task_names = TASK_NAMES.get(domain, [f"Task {i+1}" for i in range(20)])
+                n_tasks = len(task_names)
+                write("| Agent | " + " | ".join(task_names) + " | Avg |\n")
+                write("|---|" + "|".join(["---"] * (n_tasks + 1)) + "|\n")
+                # One format template per domain: label, n task scores, aggregate
+                row_tmpl = "| {} | " + "{:.0f} | " * n_tasks + "**{:.0f}** |\n"
+                task_ids = range(1, n_tasks + 1)
+                for agent, card in self.scorecards.items():
+                    if domain not in self._competes[agent]:
+                        continue
+                    ds = card.domain_scores[domain]
+                    get = ds.task_scores.get
+                    write(row_tmpl.format(AGENT_LABELS.get(agent, agent), *[get(i, 0) for i in task_ids], ds.aggregate))
+                write(f"\n![{domain_label} Latency]({domain}_latency.svg)\n")
+                write(f"![{domain_label} Tokens]({domain}_tokens.svg)\n")
 
     def generate_readme_section(self) -> str:
         """Compact benchmark section suitable for README.md."""
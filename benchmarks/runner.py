@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import dataclasses
+import functools
+import os
 import shutil
 import tempfile
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import yaml
 
@@ -18,7 +22,33 @@ from benchmarks.models import (
     BenchmarkResult,
     TaskInput,
     TaskMetrics,
+    YamlDumper,
+    YamlLoader,
 )
+from geekcode.core.agent import Agent
+from geekcode.core.coding_loop import is_coding_task
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_task_md(domain: str, path_str: str, mtime: float) -> Tuple[TaskInput, ...]:
+    """Parse a domain's task.md; *mtime* keys the cache so edits are picked up.
+
+    The cached TaskInput objects are shared; hand out :func:`_copy_task` copies.
+    """
+    return tuple(TaskInput.parse_task_md(domain, Path(path_str).read_text()))
+
+
+def _copy_task(task: TaskInput) -> TaskInput:
+    """Copy of a cached *task*, including its input file list."""
+    return dataclasses.replace(task, input_files=list(task.input_files))
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hardlink *src* to *dst*, copying when linking isn't possible (e.g. cross-device)."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
 
 
 class BenchmarkRunner:
@@ -35,10 +65,11 @@ class BenchmarkRunner:
         tasks: List[TaskInput] = []
         for d in domains:
             task_md = BENCHMARKS_DIR / d / "task.md"
-            if not task_md.exists():
+            try:
+                mtime = task_md.stat().st_mtime
+            except OSError:
                 continue
-            text = task_md.read_text()
-            tasks.extend(TaskInput.parse_task_md(d, text))
+            tasks.extend(map(_copy_task, _parse_task_md(d, str(task_md), mtime)))
         return tasks
 
     # ── Single task execution ─────────────────────────────────────────────
@@ -52,11 +83,20 @@ class BenchmarkRunner:
         """Run one task inside a temporary workspace and measure it."""
         workspace = Path(tempfile.mkdtemp(prefix="geekcode_bench_"))
         try:
-            # Copy data files into workspace
+            # Build the prompt from the task description
+            prompt = (
+                f"You are being benchmarked on a {task.domain} task.\n\n"
+                f"{task.description}\n\n"
+                "Provide a complete, high-quality answer."
+            )
+
+            # Populate workspace data. The coding loop edits input files in
+            # place, so it gets private copies; read-only tasks hardlink.
             data_src = BENCHMARKS_DIR / task.domain / "data"
             data_dst = workspace / "data"
             if data_src.exists():
-                shutil.copytree(data_src, data_dst)
+                copy_function = shutil.copy2 if is_coding_task(prompt) else _link_or_copy
+                shutil.copytree(data_src, data_dst, copy_function=copy_function)
 
             # Write a minimal .geekcode config so Agent can initialize
             gc_dir = workspace / ".geekcode"
@@ -65,21 +105,13 @@ class BenchmarkRunner:
             if model:
                 config["model"] = model
             with open(gc_dir / "config.yaml", "w") as f:
-                yaml.dump(config, f)
+                yaml.dump(config, f, Dumper=YamlDumper)
             with open(gc_dir / "state.yaml", "w") as f:
-                yaml.dump({"status": "idle"}, f)
+                yaml.dump({"status": "idle"}, f, Dumper=YamlDumper)
 
-            # Build the prompt from the task description
-            prompt = (
-                f"You are being benchmarked on a {task.domain} task.\n\n"
-                f"{task.description}\n\n"
-                "Provide a complete, high-quality answer."
-            )
             input_files = [str(data_dst / Path(p).name) for p in task.input_files if (data_dst / Path(p).name).exists()] if data_dst.exists() else []
 
             # Execute via Agent
-            from geekcode.core.agent import Agent
-
             agent = Agent(workspace)
             t0 = time.perf_counter()
             result = agent.run(prompt, files=input_files or None)
@@ -128,11 +160,18 @@ class BenchmarkRunner:
             results.append(self.run_task(task, **kwargs))
         return results
 
-    def run_all(self, **kwargs) -> List[BenchmarkResult]:
-        results = []
-        for domain in DOMAINS:
-            results.extend(self.run_domain(domain, **kwargs))
-        return results
+    def run_all(self, max_workers: Optional[int] = 1, **kwargs) -> List[BenchmarkResult]:
+        """Run every task across all domains.
+
+        Serial by default: concurrent model calls (a local Ollama queues them)
+        inflate the measured latencies. ``max_workers`` > 1 runs tasks in
+        worker processes, each with its own temporary workspace.
+        """
+        tasks = self.discover_tasks()
+        if max_workers == 1 or len(tasks) < 2:
+            return [self.run_task(task, **kwargs) for task in tasks]
+        with ProcessPoolExecutor(max_workers=max_workers) as ex:
+            return list(ex.map(functools.partial(self.run_task, **kwargs), tasks))
 
     # ── External result import ────────────────────────────────────────────
 
@@ -143,7 +182,7 @@ class BenchmarkRunner:
         The file should be a YAML list of dicts matching BenchmarkResult fields.
         """
         with open(file) as f:
-            data = yaml.safe_load(f) or []
+            data = yaml.load(f, Loader=YamlLoader) or []
         results = []
         for entry in data:
             entry.setdefault("agent", agent)
@@ -161,13 +200,14 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="GeekCode Benchmark Runner")
     parser.add_argument("--domain", choices=DOMAINS, help="Run a single domain")
     parser.add_argument("--agent", default="geekcode")
+    parser.add_argument("--workers", type=int, default=1, help="Parallel task workers (1 = serial)")
     args = parser.parse_args()
 
     runner = BenchmarkRunner(agent_name=args.agent)
     if args.domain:
         results = runner.run_domain(args.domain)
     else:
-        results = runner.run_all()
+        results = runner.run_all(max_workers=args.workers)
 
     for r in results:
         status = "OK" if r.completed else f"FAIL ({r.error})"
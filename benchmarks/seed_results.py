@@ -11,10 +11,14 @@ Domain-specific agent rosters (4 agents per domain, 20 tasks each):
 
 from __future__ import annotations
 
-import hashlib
+import functools
 import shutil
-from datetime import datetime, timezone
+import time
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import md5 as _md5
+from itertools import repeat
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from benchmarks.models import (
     DOMAIN_AGENTS,
@@ -81,76 +85,151 @@ PROFILES = {
 }
 
 
-def _hash_offset(key: str, spread: int) -> int:
-    """Deterministic pseudo-random offset from a string key."""
-    h = hashlib.md5(key.encode()).hexdigest()
-    return (int(h[:6], 16) % (2 * spread + 1)) - spread
+def _hash24(key: str, prefix_state: Any = None) -> int:
+    """24-bit deterministic hash of *key*, the noise source for the seeded data.
 
+    MD5 is kept deliberately: the published report is generated from these
+    values, and a different digest would reshuffle every seeded number.
 
-def _hash_float(key: str, spread: float) -> float:
-    """Deterministic pseudo-random float offset."""
-    h = hashlib.md5(key.encode()).hexdigest()
-    ratio = int(h[:6], 16) / 0xFFFFFF  # 0.0 to 1.0
-    return (ratio * 2 - 1) * spread
+    *prefix_state* is an ``md5`` object already fed a shared key prefix; *key*
+    is then only the suffix, and the digest equals that of the full key.
+    """
+    h = prefix_state.copy() if prefix_state is not None else _md5()
+    h.update(key.encode())
+    return int.from_bytes(h.digest()[:3], "big")
 
 
-def seed():
-    # Clean old results
-    if RESULTS_DIR.exists():
-        shutil.rmtree(RESULTS_DIR)
+@functools.lru_cache(maxsize=None)
+def _hash24_series(prefix: str, field: str, n: int) -> Tuple[int, ...]:
+    """24-bit hashes of ``{prefix}{task_id}/{field}`` for task ids 1..n.
+
+    *prefix* is hashed once and its MD5 state copied for every task. Results
+    are cached, so re-seeding in the same process skips hashing entirely.
+    """
+    state = _md5(prefix.encode())
+    return tuple(_hash24(f"{task_id}/{field}", state) for task_id in range(1, n + 1))
+
+
+def _hash_offsets(hashes: Sequence[int], spread: int) -> List[int]:
+    """Deterministic pseudo-random integer offsets in [-spread, spread], one per hash."""
+    width = 2 * spread + 1
+    return [(h % width) - spread for h in hashes]
+
+
+def _hash_floats(hashes: Sequence[int], spread: float) -> List[float]:
+    """Deterministic pseudo-random float offsets in [-spread, spread], one per hash."""
+    return [((h / 0xFFFFFF) * 2 - 1) * spread for h in hashes]
+
+
+def _profile_series(
+    agent: str, domain: str, prof: Dict[str, Any], n: int
+) -> Tuple[List[int], List[float], List[int]]:
+    """Scores, latencies and token counts for tasks 1..n of one agent/domain.
+
+    Each series is produced in one pass so the task loop in :func:`_seed_agent`
+    only assembles result objects.
+    """
+    prefix = f"{agent}/{domain}/"
+    base = prof["score"]
+    offsets = _hash_offsets(_hash24_series(prefix, "score", n), prof["spread"])
+    scores = [max(40, min(100, base + o)) for o in offsets]
+    base = prof["latency"]
+    offsets = _hash_floats(_hash24_series(prefix, "lat", n), prof["lat_spread"])
+    latencies = [max(3.0, round(base + o, 1)) for o in offsets]
+    base = prof["tokens"]
+    offsets = _hash_offsets(_hash24_series(prefix, "tok", n), prof["tok_spread"])
+    tokens = [max(800, base + o) for o in offsets]
+    return scores, latencies, tokens
 
-    now = datetime.now(timezone.utc).isoformat()
+
+def _seed_agent(agent: str, now: str, num_tasks: int) -> int:
+    """Seed every domain *agent* competes in; returns the number of results.
+
+    Agents own disjoint result trees (including their metrics index), so
+    agents can be seeded in separate processes.
+    """
     count = 0
-    num_tasks = 20
+    is_geekcode = agent == "geekcode"
+    save_factor = 0.15 if is_geekcode else 0.0
+    ctx_retention = 0.92 if is_geekcode else 0.6
+    resume_ok = RESUME_MAP[agent]
+    switch_ok = SWITCH_MAP[agent]
 
     for domain in DOMAINS:
-        agents_for_domain = DOMAIN_AGENTS[domain]
-        domain_profiles = PROFILES[domain]
+        if agent not in DOMAIN_AGENTS[domain]:
+            continue
+        prof = PROFILES[domain].get(agent)
+        if prof is None:
+            continue
+
+        model = GEEKCODE_MODELS.get(domain) if is_geekcode else MODEL_MAP[agent]
         task_names = TASK_NAMES[domain]
+        output_prefix = f"[Simulated output for {agent}/{domain}/"
+        scores, latencies, token_counts = _profile_series(agent, domain, prof, num_tasks)
+        batch = []
+        for i in range(num_tasks):
+            task_id = i + 1
+            task_name = task_names[i]
+            score, latency, tokens = scores[i], latencies[i], token_counts[i]
+            accuracy = score / 100.0
+
+            metrics = TaskMetrics(
+                accuracy=accuracy,
+                latency_seconds=latency,
+                tokens_used=tokens,
+                tokens_saved=int(tokens * save_factor),
+                cached=is_geekcode,
+                resume_success=resume_ok,
+                model_switch_success=switch_ok,
+                context_retention=ctx_retention,
+                citation_accuracy=accuracy * 0.9,
+            )
+            result = BenchmarkResult(
+                timestamp=now,
+                agent=agent,
+                domain=domain,
+                task_id=task_id,
+                scenario="baseline",
+                model=model,
+                output=output_prefix + task_name + "]",
+                metrics=metrics,
+                completed=True,
+            )
+            batch.append(result)
+        BenchmarkResult.save_many(batch)
+        count += len(batch)
+    return count
+
+
+def seed(max_workers: Optional[int] = 1):
+    """Regenerate all seeded results.
+
+    ``max_workers`` > 1 seeds agents in parallel worker processes; the output
+    is identical to a serial run.
+    """
+    # Clean old results. Dropping the tree and recreating it is cheaper than
+    # truncating files in place; bulk readers use each agent's index.jsonl.
+    if RESULTS_DIR.exists():
+        shutil.rmtree(RESULTS_DIR)
+
+    # One UTC timestamp shared by every seeded result (second precision)
+    now = time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
+    num_tasks = 20
+    agents = list(dict.fromkeys(a for domain in DOMAINS for a in DOMAIN_AGENTS[domain]))
 
-        for agent in agents_for_domain:
-            prof = domain_profiles.get(agent)
-            if prof is None:
-                continue
-
-            model = GEEKCODE_MODELS.get(domain) if agent == "geekcode" else MODEL_MAP[agent]
-
-            for i in range(num_tasks):
-                task_id = i + 1
-                task_name = task_names[i]
-                key = f"{agent}/{domain}/{task_id}"
-
-                score = max(40, min(100, prof["score"] + _hash_offset(key + "/score", prof["spread"])))
-                latency = max(3.0, round(prof["latency"] + _hash_float(key + "/lat", prof["lat_spread"]), 1))
-                tokens = max(800, prof["tokens"] + _hash_offset(key + "/tok", prof["tok_spread"]))
-
-                metrics = TaskMetrics(
-                    accuracy=score / 100.0,
-                    latency_seconds=latency,
-                    tokens_used=tokens,
-                    tokens_saved=int(tokens * 0.15) if agent == "geekcode" else 0,
-                    cached=agent == "geekcode",
-                    resume_success=RESUME_MAP[agent],
-                    model_switch_success=SWITCH_MAP[agent],
-                    context_retention=0.92 if agent == "geekcode" else 0.6,
-                    citation_accuracy=score / 100.0 * 0.9,
-                )
-                result = BenchmarkResult(
-                    timestamp=now,
-                    agent=agent,
-                    domain=domain,
-                    task_id=task_id,
-                    scenario="baseline",
-                    model=model,
-                    output=f"[Simulated output for {agent}/{domain}/{task_name}]",
-                    metrics=metrics,
-                    completed=True,
-                )
-                result.save()
-                count += 1
+    if max_workers == 1:
+        count = sum(_seed_agent(agent, now, num_tasks) for agent in agents)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as ex:
+            count = sum(ex.map(_seed_agent, agents, repeat(now), repeat(num_tasks)))
 
     print(f"Seeded {count} benchmark results ({num_tasks} tasks x {len(DOMAINS)} domains x 4 agents).")
 
 
 if __name__ == "__main__":
-    seed()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Seed GeekCode benchmark results")
+    parser.add_argument("--workers", type=int, default=1, help="Parallel seeding workers (1 = serial)")
+    args = parser.parse_args()
+    seed(max_workers=args.workers)
@@ -0,0 +1,65 @@
+"""
+Keep keystrokes typed while the REPL starts up.
+
+Bytes typed before the first prompt stay queued in the terminal, and
+prompt_toolkit reads them once it switches to raw mode (it does not flush
+pending input). The terminal still echoes them, though, so they end up
+scribbled over the banner. Turning echo off for the startup window keeps
+the screen clean; the first prompt then shows the queued text in its
+input buffer.
+"""
+
+import atexit
+import sys
+from typing import Any, List, Optional, TextIO
+
+try:
+    import termios
+except ImportError:  # Windows
+    termios = None  # type: ignore[assignment]
+
+# (fd, saved termios attributes) while capturing
+_saved: Optional[tuple] = None
+
+
+def start_capturing_early_input(stream: Optional[TextIO] = None) -> bool:
+    """Stop the terminal echoing input until :func:`stop_capturing_early_input`.
+
+    Returns False (and does nothing) when *stream* is not a terminal or
+    termios is unavailable.
+    """
+    global _saved
+    stream = stream or sys.stdin
+    if termios is None or _saved is not None:
+        return False
+    try:
+        if not stream.isatty():
+            return False
+        fd = stream.fileno()
+        attrs: List[Any] = termios.tcgetattr(fd)
+        quiet = list(attrs)
+        quiet[3] = quiet[3] & ~termios.ECHO  # lflag
+        # TCSANOW keeps anything already typed in the input queue
+        termios.tcsetattr(fd, termios.TCSANOW, quiet)
+    except (OSError, ValueError, termios.error):
+        return False
+    _saved = (fd, attrs)
+    atexit.register(stop_capturing_early_input)
+    return True
+
+
+def stop_capturing_early_input() -> None:
+    """Restore the terminal settings saved by :func:`start_capturing_early_input`.
+
+    Queued input is left in place for the next reader. Safe to call more
+    than once.
+    """
+    global _saved
+    if _saved is None:
+        return
+    fd, attrs = _saved
+    _saved = None
+    try:
+        termios.tcsetattr(fd, termios.TCSANOW, attrs)
+    except (OSError, termios.error):
+        pass
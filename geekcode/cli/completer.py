@@ -4,13 +4,16 @@ GeekCode CLI Completer - prompt_toolkit completion for the REPL.
 Provides real-time dropdown suggestions for slash commands and model names.
 """
 
-from typing import Callable, List, Optional
+import time
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 from prompt_toolkit.completion import Completer, Completion
 
 
 # (command, description) — used for dropdown display
-SLASH_COMMANDS = [
+SLASH_COMMANDS: Tuple[Tuple[str, str], ...] = (
     ("/help", "Show help"),
     ("/?", "Show help"),
     ("/status", "Current state, model, cache stats"),
@@ -32,10 +35,10 @@ SLASH_COMMANDS = [
     ("/exit", "Exit GeekCode"),
     ("/quit", "Exit GeekCode"),
     ("/q", "Exit GeekCode"),
-]
+)
 
 # Static model suggestions (provider/model format)
-KNOWN_MODELS = [
+KNOWN_MODELS: Tuple[Tuple[str, str], ...] = (
     ("openai/gpt-4o", "OpenAI"),
     ("openai/gpt-4o-mini", "OpenAI"),
     ("openai/gpt-4-turbo", "OpenAI"),
@@ -59,7 +62,64 @@ KNOWN_MODELS = [
     ("openrouter/anthropic/claude-sonnet-4-5", "OpenRouter"),
     ("openrouter/deepseek/deepseek-r1", "OpenRouter"),
     ("openrouter/meta-llama/llama-3.3-70b-instruct", "OpenRouter"),
-]
+)
+
+# Seconds a fetched Ollama model list is reused before asking again
+OLLAMA_CACHE_TTL = 5.0
+
+
+def _build_prefix_index(keys: Sequence[str]) -> List[Tuple[str, int]]:
+    """Sort ``(key, position)`` pairs so prefix matches form one contiguous run."""
+    return sorted((key, i) for i, key in enumerate(keys))
+
+
+def _prefix_matches(index: List[Tuple[str, int]], prefix: str) -> List[int]:
+    """Positions of keys starting with *prefix*, in their original order.
+
+    Bisects to the first candidate and stops at the first non-match, so only
+    the matching run of the sorted index is visited.
+    """
+    positions = []
+    for i in range(bisect_left(index, (prefix,)), len(index)):
+        key, pos = index[i]
+        if not key.startswith(prefix):
+            break
+        positions.append(pos)
+    positions.sort()
+    return positions
+
+
+# Commands bucketed on their first two characters ("/h" -> /help, /history),
+# each bucket in declaration order, so a keystroke only scans its own bucket
+_CMDS_BY_PREFIX2: Dict[str, List[Tuple[str, str]]] = {}
+for _entry in SLASH_COMMANDS:
+    _CMDS_BY_PREFIX2.setdefault(_entry[0][:2], []).append(_entry)
+del _entry
+_MODEL_INDEX = _build_prefix_index([model.lower() for model, _ in KNOWN_MODELS])
+
+
+# Completions for static entries depend only on the typed text, and
+# prompt_toolkit never mutates them, so each keystroke's set is built once.
+@lru_cache(maxsize=256)
+def _command_completions(text: str) -> Tuple[Completion, ...]:
+    """Slash-command completions for *text*; a bare "/" lists everything."""
+    candidates = SLASH_COMMANDS if len(text) < 2 else _CMDS_BY_PREFIX2.get(text[:2], ())
+    return tuple(
+        Completion(cmd, start_position=-len(text), display_meta=description)
+        for cmd, description in candidates
+        if cmd.startswith(text)
+    )
+
+
+@lru_cache(maxsize=256)
+def _static_model_completions(prefix: str) -> Tuple[Completion, ...]:
+    """Completions from KNOWN_MODELS matching *prefix* case-insensitively."""
+    return tuple(
+        Completion(model, start_position=-len(prefix), display_meta=provider_label)
+        for model, provider_label in (
+            KNOWN_MODELS[pos] for pos in _prefix_matches(_MODEL_INDEX, prefix.lower())
+        )
+    )
 
 
 class GeekCodeCompleter(Completer):
@@ -72,6 +132,31 @@ class GeekCodeCompleter(Completer):
 
     def __init__(self, ollama_models_fn: Optional[Callable[[], List[str]]] = None):
         self._ollama_models_fn = ollama_models_fn
+        # (fetched_at, [(full_name, full_lower, model_lower), ...])
+        self._ollama_cache: Optional[Tuple[float, List[Tuple[str, str, str]]]] = None
+
+    def _ollama_models(self) -> List[Tuple[str, str, str]]:
+        """Ollama models with pre-lowercased names, refreshed at most every TTL.
+
+        The completer runs on every keystroke, so the lookup (which may shell
+        out or hit the Ollama API) must not run each time. Failures are cached
+        as an empty list for the same period.
+        """
+        fn = self._ollama_models_fn
+        if fn is None:
+            return []
+        now = time.monotonic()
+        if self._ollama_cache is not None and now - self._ollama_cache[0] < OLLAMA_CACHE_TTL:
+            return self._ollama_cache[1]
+        try:
+            models = [
+                (f"ollama/{m}", f"ollama/{m}".lower(), m.lower())
+                for m in fn()
+            ]
+        except Exception:
+            models = []
+        self._ollama_cache = (now, models)
+        return models
 
     def get_completions(self, document, complete_event):
         text = document.text_before_cursor
@@ -80,20 +165,14 @@ class GeekCodeCompleter(Completer):
         if not text.startswith("/"):
             return
 
-        # /model <partial> — complete model names
-        if text.startswith("/model ") and not text.startswith("/models"):
+        # /model <partial> — complete model names ("/models" never matches)
+        if text.startswith("/model "):
             model_prefix = text[7:]  # after "/model "
             yield from self._complete_model_names(model_prefix)
             return
 
         # Slash command completion
-        for cmd, description in SLASH_COMMANDS:
-            if cmd.startswith(text):
-                yield Completion(
-                    cmd,
-                    start_position=-len(text),
-                    display_meta=description,
-                )
+        yield from _command_completions(text)
 
     def _complete_model_names(self, prefix: str):
         """Yield model name completions in provider/model format."""
@@ -102,26 +181,18 @@ class GeekCodeCompleter(Completer):
 
         # Dynamic Ollama models first (from live instance)
         if self._ollama_models_fn:
-            try:
-                for m in self._ollama_models_fn():
-                    full = f"ollama/{m}"
-                    if full.lower().startswith(prefix_lower) or m.lower().startswith(prefix_lower):
-                        if full not in seen:
-                            seen.add(full)
-                            yield Completion(
-                                full,
-                                start_position=-len(prefix),
-                                display_meta="Ollama (local)",
-                            )
-            except Exception:
-                pass
+            for full, full_lower, m_lower in self._ollama_models():
+                if full_lower.startswith(prefix_lower) or m_lower.startswith(prefix_lower):
+                    if full not in seen:
+                        seen.add(full)
+                        yield Completion(
+                            full,
+                            start_position=-len(prefix),
+                            display_meta="Ollama (local)",
+                        )
 
         # Static known models
-        for model, provider_label in KNOWN_MODELS:
-            if model.lower().startswith(prefix_lower) and model not in seen:
-                seen.add(model)
-                yield Completion(
-                    model,
-                    start_position=-len(prefix),
-                    display_meta=provider_label,
-                )
+        for completion in _static_model_completions(prefix):
+            if completion.text not in seen:
+                seen.add(completion.text)
+                yield completion
@@ -5,33 +5,87 @@ Run `geekcode` to start the agent in current directory.
 All state managed in .geekcode/ files.
 """
 
+import copy
+import functools
 import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import click
+import yaml
 from rich.console import Console
 from rich.panel import Panel
-from rich.markdown import Markdown
-from rich.prompt import Prompt
-from rich.live import Live
-from rich.spinner import Spinner
 from rich.text import Text
 
 from geekcode import __version__
+from geekcode.cli._early_input import start_capturing_early_input, stop_capturing_early_input
+from geekcode.core.agent import HISTORY_INDEX
+from geekcode.utils.yaml_io import YamlDumper, YamlLoader
+
+if TYPE_CHECKING:
+    from geekcode.core.cache import CacheEngine
+    from geekcode.mcporter.registry import ToolRegistry
 
 console = Console()
 
 
 def find_workspace() -> Path:
     """Find workspace root (has .geekcode/) or use current directory."""
-    current = Path.cwd()
-    while current != current.parent:
-        if (current / ".geekcode").exists():
-            return current
-        current = current.parent
-    return Path.cwd()
+    return _find_workspace_from(os.getcwd())
+
+
+@functools.lru_cache(maxsize=8)
+def _find_workspace_from(cwd: str) -> Path:
+    """Walk up from *cwd* with one stat per level; cached per directory."""
+    current = cwd
+    while True:
+        parent = os.path.dirname(current)
+        if parent == current:  # filesystem root is never a workspace
+            return Path(cwd)
+        try:
+            os.stat(os.path.join(current, ".geekcode"))
+            return Path(current)
+        except OSError:
+            current = parent
+
+
+def _tail_lines(path: Path, count: int, block_size: int = 65536) -> List[str]:
+    """Return up to the last *count* lines of *path*, reading backwards in blocks."""
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        data = b""
+        while pos > 0 and data.count(b"\n") <= count:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    lines = data.decode("utf-8", errors="replace").splitlines()
+    if pos > 0:
+        lines = lines[1:]  # first line may be cut mid-way
+    return lines[-count:]
+
+
+def _preload_markdown() -> None:
+    """Import rich.markdown (markdown_it, pygments) ahead of the first answer."""
+    try:
+        import rich.markdown  # noqa: F401
+    except Exception:
+        pass
+
+
+def _print_markdown(text: str) -> None:
+    """Render Markdown, writing each line as soon as Rich has laid it out.
+
+    Rich renders Markdown element by element, so long answers start
+    appearing before later code blocks are highlighted. The output is the
+    same as ``console.print(Markdown(text))``.
+    """
+    from rich.markdown import Markdown
+    from rich.segment import Segment, Segments
+
+    for line in Segment.split_lines(console.render(Markdown(text))):
+        console.print(Segments([*line, Segment.line()]), end="")
 
 
 def _query_ollama_models():
@@ -61,9 +115,18 @@ def _query_ollama_models():
 
 
 def _detect_ollama() -> bool:
-    """Check if Ollama is running locally."""
-    running, _ = _query_ollama_models()
-    return running
+    """Check if Ollama is running locally (something listens on its port).
+
+    A bare TCP connect avoids importing httpx and a full HTTP round trip
+    during first-time setup.
+    """
+    import socket
+
+    try:
+        with socket.create_connection(("localhost", 11434), timeout=0.2):
+            return True
+    except OSError:
+        return False
 
 
 MODEL_CHOICES = [
@@ -79,6 +142,11 @@ MODEL_CHOICES = [
 
 def _run_first_time_setup(workspace: Path) -> dict:
     """Interactive setup on first run. Returns config dict."""
+    from rich.prompt import Prompt
+
+    # Setup prompts need the terminal to echo again
+    stop_capturing_early_input()
+
     console.print()
     console.print("[bold blue]Welcome to GeekCode![/bold blue]")
     console.print(f"[dim]Setting up project: {workspace.name}[/dim]\n")
@@ -192,18 +260,43 @@ def _print_startup_guidelines(config: dict) -> None:
     console.print()
 
 
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Replace *path* with *data* so readers never see a partial file.
+
+    The bytes go to a sibling temp file that is then renamed over *path*; an
+    interrupt mid-write leaves the old file intact rather than truncated.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _write_initial_files(geekcode_dir: Path, config: dict) -> None:
+    """Write the initial config.yaml and an idle state.yaml."""
+    initial = (
+        ("config.yaml", yaml.dump(config, Dumper=YamlDumper, default_flow_style=False)),
+        ("state.yaml", yaml.dump({"status": "idle"}, Dumper=YamlDumper)),
+    )
+    for name, text in initial:
+        _atomic_write(geekcode_dir / name, text.encode("utf-8"))
+
+
 def ensure_initialized(workspace: Path, interactive: bool = True) -> Path:
     """Ensure .geekcode/ exists. Run first-time setup if interactive."""
     geekcode_dir = workspace / ".geekcode"
 
     if not geekcode_dir.exists():
-        import yaml
-
-        # Create directory structure
-        geekcode_dir.mkdir(parents=True)
-        (geekcode_dir / "context").mkdir()
-        (geekcode_dir / "cache").mkdir()
-        (geekcode_dir / "history").mkdir()
+        # Create directory structure (the first makedirs also creates .geekcode/)
+        for sub in ("context", "cache", "history"):
+            os.makedirs(geekcode_dir / sub)
 
         # Interactive setup or silent defaults
         if interactive and sys.stdin.isatty():
@@ -215,11 +308,7 @@ def ensure_initialized(workspace: Path, interactive: bool = True) -> Path:
                 "resume": {"auto": True},
             }
 
-        with open(geekcode_dir / "config.yaml", "w") as f:
-            yaml.dump(config, f, default_flow_style=False)
-
-        with open(geekcode_dir / "state.yaml", "w") as f:
-            yaml.dump({"status": "idle"}, f)
+        _write_initial_files(geekcode_dir, config)
 
         # Index workspace files on first run
         console.print("[dim]Indexing workspace files...[/dim]")
@@ -239,18 +328,83 @@ def ensure_initialized(workspace: Path, interactive: bool = True) -> Path:
     return geekcode_dir
 
 
+# ── Constant renderables (markup parsed once, reused on every print) ────────
+
+_BANNER_ART = Text(r"""
+  ██████╗ ███████╗███████╗██╗  ██╗ ██████╗ ██████╗ ██████╗ ███████╗
+ ██╔════╝ ██╔════╝██╔════╝██║ ██╔╝██╔════╝██╔═══██╗██╔══██╗██╔════╝
+ ██║  ███╗█████╗  █████╗  █████╔╝ ██║     ██║   ██║██║  ██║█████╗
+ ██║   ██║██╔══╝  ██╔══╝  ██╔═██╗ ██║     ██║   ██║██║  ██║██╔══╝
+ ╚██████╔╝███████╗███████╗██║  ██╗╚██████╗╚██████╔╝██████╔╝███████╗
+  ╚═════╝ ╚══════╝╚══════╝╚═╝  ╚═╝ ╚═════╝ ╚═════╝╚═════╝ ╚══════╝""", style="bold blue")
+
+_GOODBYE_PANEL = Panel(
+    Text.from_markup(
+        "[bold blue]Thanks for using GeekCode![/bold blue]\n"
+        "[dim]Your session is saved in .geekcode/[/dim]\n"
+        "[dim]See you next time![/dim]"
+    ),
+    border_style="blue",
+    padding=(1, 2),
+)
+
+_HELP_TEXT = """
+[bold]Commands:[/bold]
+  /help, /?                Show this help
+  /status                  Current state, model, cache stats
+  /history                 Recent task history
+  /models                  List available providers and models
+  /model <name>            Switch model (e.g., /model gpt-4o)
+  /tools                   List MCPorter tools and token savings
+  /tools refresh           Re-fetch tool manifests from MCP servers
+  /tools info <name>       Show full schema for a specific tool
+  /benchmark run [domain]  Run benchmarks (all or single domain)
+  /benchmark report        Generate SVG charts and markdown report
+  /loop                    Show coding loop status
+  /loop resume             Resume interrupted coding loop
+  /loop reset              Clear coding loop checkpoint
+  /reindex                 Re-index workspace files for context
+  /newchat                 Start fresh conversation (clear context)
+  /clear                   Clear screen
+  /reset                   Reset task state
+  /exit, /quit, /q         Exit GeekCode
+
+[bold]Usage:[/bold]
+  Just type your task and press Enter.
+
+[bold]Examples:[/bold]
+  > Explain this codebase
+  > What does the config file do?
+  > Add tests for the user service
+  > Analyze the insurance policy in docs/
+"""
+
+_HELP_PANEL = Panel(Text.from_markup(_HELP_TEXT.strip()), title="GeekCode Help", border_style="blue")
+
+# "Did you mean" candidates keyed by every 1-3 character prefix, so an
+# unknown command's suggestions are one lookup on its first three characters
+_SUGGESTIONS: Dict[str, List[str]] = {}
+for _cmd in ("/help", "/status", "/history", "/models", "/model", "/tools", "/benchmark",
+             "/loop", "/reindex", "/newchat", "/clear", "/reset", "/exit", "/quit"):
+    for _n in range(1, 4):
+        _SUGGESTIONS.setdefault(_cmd[:_n], []).append(_cmd)
+del _cmd, _n
+
+
 class GeekCodeREPL:
     """
     Interactive chat interface for GeekCode.
 
-    This REPL holds NO state. Every command:
+    Task state lives only in .geekcode/ files. Every command:
     - Creates a fresh Agent instance
     - Agent reads from files
     - Agent writes to files
     - Agent returns result
     - REPL displays result
 
-    No memory between commands - everything is in .geekcode/ files.
+    Between commands the REPL keeps only caches that are checked against
+    or read from those files on use: parsed config/state YAML (keyed on
+    mtime and size) and a shared CacheEngine and ToolRegistry.
     """
 
     def __init__(self, workspace: Path):
@@ -260,8 +414,43 @@ class GeekCodeREPL:
         self._ctrlc_count = 0
         self._input_count = 0
         self._ollama_models_cache = None
+        # path -> ((st_mtime_ns, st_size), parsed) for config/state YAML
+        self._yaml_cache: Dict[Path, Tuple[Tuple[int, int], dict]] = {}
+        # Created on first use and shared by later commands; both read
+        # their data from disk on every call, so reuse never goes stale
+        self._cache_engine: Optional["CacheEngine"] = None
+        self._tool_registry: Optional["ToolRegistry"] = None
         self._init_prompt_session()
 
+    def _load_yaml(self, path: Path) -> dict:
+        """Parse a .geekcode/ YAML file, reusing the last parse while it is unchanged.
+
+        Keyed on mtime and size, so writes by the agent or by hand are picked
+        up. Missing or empty files load as {}. Returns a deep copy, so callers
+        may modify the result without touching the cache.
+        """
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            self._yaml_cache.pop(path, None)
+            return {}
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._yaml_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return copy.deepcopy(cached[1])
+
+        with open(path) as f:
+            data = yaml.load(f, Loader=YamlLoader) or {}
+        self._yaml_cache[path] = (key, data)
+        return copy.deepcopy(data)
+
+    def _dump_yaml(self, path: Path, data: dict, **kwargs: Any) -> None:
+        """Write *data* to a .geekcode/ YAML file and keep the parse cache current."""
+        text = yaml.dump(data, Dumper=YamlDumper, **kwargs)
+        _atomic_write(path, text.encode("utf-8"))
+        st = path.stat()
+        self._yaml_cache[path] = ((st.st_mtime_ns, st.st_size), copy.deepcopy(data))
+
     def _get_ollama_models(self):
         """Get cached Ollama model names (lazy load)."""
         if self._ollama_models_cache is None:
@@ -357,14 +546,7 @@ class GeekCodeREPL:
 
     def _print_banner(self):
         """Print welcome banner with ASCII art."""
-        ascii_art = r"""
-  ██████╗ ███████╗███████╗██╗  ██╗ ██████╗ ██████╗ ██████╗ ███████╗
- ██╔════╝ ██╔════╝██╔════╝██║ ██╔╝██╔════╝██╔═══██╗██╔══██╗██╔════╝
- ██║  ███╗█████╗  █████╗  █████╔╝ ██║     ██║   ██║██║  ██║█████╗
- ██║   ██║██╔══╝  ██╔══╝  ██╔═██╗ ██║     ██║   ██║██║  ██║██╔══╝
- ╚██████╔╝███████╗███████╗██║  ██╗╚██████╗╚██████╔╝██████╔╝███████╗
-  ╚═════╝ ╚══════╝╚══════╝╚═╝  ╚═╝ ╚═════╝ ╚═════╝╚═════╝ ╚══════╝"""
-        console.print(Text(ascii_art, style="bold blue"))
+        console.print(_BANNER_ART)
         console.print()
         info = Text()
         info.append(f"  v{__version__}", style="bold cyan")
@@ -378,65 +560,16 @@ class GeekCodeREPL:
     def _print_goodbye(self):
         """Print farewell visual."""
         console.print()
-        console.print(Panel(
-            "[bold blue]Thanks for using GeekCode![/bold blue]\n"
-            f"[dim]Your session is saved in .geekcode/[/dim]\n"
-            "[dim]See you next time![/dim]",
-            border_style="blue",
-            padding=(1, 2),
-        ))
+        console.print(_GOODBYE_PANEL)
 
     def _print_help(self):
         """Print help message."""
-        help_text = """
-[bold]Commands:[/bold]
-  /help, /?                Show this help
-  /status                  Current state, model, cache stats
-  /history                 Recent task history
-  /models                  List available providers and models
-  /model <name>            Switch model (e.g., /model gpt-4o)
-  /tools                   List MCPorter tools and token savings
-  /tools refresh           Re-fetch tool manifests from MCP servers
-  /tools info <name>       Show full schema for a specific tool
-  /benchmark run [domain]  Run benchmarks (all or single domain)
-  /benchmark report        Generate SVG charts and markdown report
-  /loop                    Show coding loop status
-  /loop resume             Resume interrupted coding loop
-  /loop reset              Clear coding loop checkpoint
-  /reindex                 Re-index workspace files for context
-  /newchat                 Start fresh conversation (clear context)
-  /clear                   Clear screen
-  /reset                   Reset task state
-  /exit, /quit, /q         Exit GeekCode
-
-[bold]Usage:[/bold]
-  Just type your task and press Enter.
-
-[bold]Examples:[/bold]
-  > Explain this codebase
-  > What does the config file do?
-  > Add tests for the user service
-  > Analyze the insurance policy in docs/
-"""
-        console.print(Panel(help_text.strip(), title="GeekCode Help", border_style="blue"))
+        console.print(_HELP_PANEL)
 
     def _print_status(self):
         """Print current status."""
-        import yaml
-
-        state_file = self.geekcode_dir / "state.yaml"
-        config_file = self.geekcode_dir / "config.yaml"
-
-        state = {}
-        config = {}
-
-        if state_file.exists():
-            with open(state_file) as f:
-                state = yaml.safe_load(f) or {}
-
-        if config_file.exists():
-            with open(config_file) as f:
-                config = yaml.safe_load(f) or {}
+        state = self._load_yaml(self.geekcode_dir / "state.yaml")
+        config = self._load_yaml(self.geekcode_dir / "config.yaml")
 
         console.print(f"[cyan]Project:[/cyan] {config.get('project', {}).get('name', self.workspace.name)}")
         console.print(f"[cyan]Model:[/cyan] {config.get('model', 'default')}")
@@ -446,14 +579,52 @@ class GeekCodeREPL:
             console.print(f"[cyan]Task:[/cyan] {state['current_task'][:60]}...")
 
         # Cache stats
-        from geekcode.core.cache import CacheEngine
-        cache = CacheEngine(self.geekcode_dir / "cache")
-        stats = cache.stats()
+        stats = self._get_cache_engine().stats()
         console.print(f"[cyan]Cache:[/cyan] {stats['hits']} hits, ~{stats['tokens_saved_estimate']} tokens saved")
 
-    def _print_history(self, days: int = 7):
-        """Print task history."""
-        import yaml
+    def _get_cache_engine(self) -> "CacheEngine":
+        """The session's CacheEngine, created on first use."""
+        if self._cache_engine is None:
+            from geekcode.core.cache import CacheEngine
+            self._cache_engine = CacheEngine(self.geekcode_dir / "cache")
+        return self._cache_engine
+
+    def _get_tool_registry(self) -> "ToolRegistry":
+        """The session's MCPorter ToolRegistry, created on first use."""
+        if self._tool_registry is None:
+            from geekcode.mcporter.registry import ToolRegistry
+            self._tool_registry = ToolRegistry(self.geekcode_dir)
+        return self._tool_registry
+
+    def _recent_history(self, history_dir: Path, limit: int) -> List[dict]:
+        """Up to *limit* history entries, newest first.
+
+        Tails the JSON-lines index; workspaces whose history predates the
+        index fall back to parsing the daily YAML files.
+        """
+        import json
+
+        index_file = history_dir / HISTORY_INDEX
+        if index_file.exists():
+            entries = []
+            for line in reversed(_tail_lines(index_file, limit)):
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    continue
+            return entries
+
+        entries = []
+        for history_file in sorted(history_dir.glob("*.yaml"), reverse=True):
+            with open(history_file) as f:
+                data = yaml.load(f, Loader=YamlLoader) or []
+            entries.extend(reversed(data))
+            if len(entries) >= limit:
+                break
+        return entries[:limit]
+
+    def _print_history(self, days: int = 7, limit: int = 10):
+        """Print the most recent task history, newest first."""
         from datetime import datetime, timedelta
         from rich.table import Table
 
@@ -465,13 +636,11 @@ class GeekCodeREPL:
         cutoff = datetime.utcnow() - timedelta(days=days)
         entries = []
 
-        for history_file in sorted(history_dir.glob("*.yaml"), reverse=True):
-            with open(history_file) as f:
-                data = yaml.safe_load(f) or []
-            for entry in data:
-                ts = datetime.fromisoformat(entry.get("timestamp", "2000-01-01"))
-                if ts >= cutoff:
-                    entries.append(entry)
+        for entry in self._recent_history(history_dir, limit):
+            ts = datetime.fromisoformat(str(entry.get("timestamp", "2000-01-01")))
+            if ts < cutoff:
+                break  # entries are newest first
+            entries.append(entry)
 
         if not entries:
             console.print("[dim]No recent history[/dim]")
@@ -482,9 +651,9 @@ class GeekCodeREPL:
         table.add_column("Task", style="white")
         table.add_column("", width=3)
 
-        for entry in entries[:10]:
+        for entry in entries:
             table.add_row(
-                entry.get("timestamp", "")[:16].replace("T", " "),
+                str(entry.get("timestamp", ""))[:16].replace("T", " "),
                 entry.get("task", "")[:50],
                 "⚡" if entry.get("cached") else "",
             )
@@ -493,15 +662,10 @@ class GeekCodeREPL:
 
     def _list_models(self):
         """List available providers and popular models."""
-        import yaml
         from rich.table import Table
 
         # Read current model from config
-        config_file = self.geekcode_dir / "config.yaml"
-        config = {}
-        if config_file.exists():
-            with open(config_file) as f:
-                config = yaml.safe_load(f) or {}
+        config = self._load_yaml(self.geekcode_dir / "config.yaml")
         current = config.get("model", "")
 
         # Query Ollama for installed models
@@ -570,8 +734,6 @@ class GeekCodeREPL:
 
     def _switch_model(self, model_name: str):
         """Switch to a different model. Requires provider/model format."""
-        import yaml
-
         # Enforce provider/model format for ambiguous names
         if "/" not in model_name:
             # Allow well-known unambiguous prefixes without provider
@@ -609,23 +771,15 @@ class GeekCodeREPL:
             return
 
         config_file = self.geekcode_dir / "config.yaml"
-        config = {}
-        if config_file.exists():
-            with open(config_file) as f:
-                config = yaml.safe_load(f) or {}
-
+        config = self._load_yaml(config_file)
         config["model"] = model_name
-
-        with open(config_file, "w") as f:
-            yaml.dump(config, f)
+        self._dump_yaml(config_file, config)
 
         console.print(f"[green]Switched to {model_name}[/green]")
 
     def _reset_state(self):
         """Reset task state."""
-        import yaml
-        with open(self.geekcode_dir / "state.yaml", "w") as f:
-            yaml.dump({"status": "idle"}, f)
+        self._dump_yaml(self.geekcode_dir / "state.yaml", {"status": "idle"})
         console.print("[green]State reset[/green]")
 
     def _new_chat(self):
@@ -654,18 +808,13 @@ class GeekCodeREPL:
 
     def _save_paused_state(self, task: str):
         """Save paused state so the task can be resumed later."""
-        import yaml
         from datetime import datetime
         state_file = self.geekcode_dir / "state.yaml"
-        state = {}
-        if state_file.exists():
-            with open(state_file) as f:
-                state = yaml.safe_load(f) or {}
+        state = self._load_yaml(state_file)
         state["status"] = "paused"
         state["paused_task"] = task
         state["paused_at"] = datetime.utcnow().isoformat()
-        with open(state_file, "w") as f:
-            yaml.dump(state, f, default_flow_style=False)
+        self._dump_yaml(state_file, state, default_flow_style=False)
 
     def _execute_task(self, task: str):
         """Execute a user task."""
@@ -691,9 +840,8 @@ class GeekCodeREPL:
             # Render response as markdown
             console.print()
             try:
-                md = Markdown(result.output)
-                console.print(md)
-            except:
+                _print_markdown(result.output)
+            except Exception:
                 console.print(result.output)
             console.print()
 
@@ -702,69 +850,64 @@ class GeekCodeREPL:
         else:
             console.print(f"[red]Error: {result.error}[/red]")
 
+    # Slash command -> (handler method, whether it takes the argument string)
+    _HANDLERS = {
+        "/help": ("_print_help", False),
+        "/?": ("_print_help", False),
+        "/status": ("_print_status", False),
+        "/history": ("_print_history", False),
+        "/models": ("_list_models", False),
+        "/model": ("_model_command", True),
+        "/clear": ("_clear_screen", False),
+        "/reset": ("_reset_state", False),
+        "/tools": ("_handle_tools", True),
+        "/benchmark": ("_handle_benchmark", True),
+        "/loop": ("_handle_loop", True),
+        "/reindex": ("_reindex_workspace", False),
+        "/newchat": ("_new_chat", False),
+    }
+    _EXIT_COMMANDS = frozenset(("/exit", "/quit", "/q"))
+
     def _handle_command(self, cmd: str) -> bool:
         """Handle a slash command. Returns True if should continue."""
         parts = cmd.split(maxsplit=1)
         command = parts[0].lower()
         args = parts[1] if len(parts) > 1 else ""
 
-        if command in ("/exit", "/quit", "/q"):
+        if command in self._EXIT_COMMANDS:
             self.running = False
             return False
 
-        elif command in ("/help", "/?"):
-            self._print_help()
-
-        elif command == "/status":
-            self._print_status()
-
-        elif command == "/history":
-            self._print_history()
-
-        elif command == "/models":
-            self._list_models()
-
-        elif command == "/model":
-            if args:
-                self._switch_model(args)
+        handler = self._HANDLERS.get(command)
+        if handler is not None:
+            name, takes_args = handler
+            method = getattr(self, name)
+            if takes_args:
+                method(args)
             else:
-                self._list_models()
-
-        elif command == "/clear":
-            console.clear()
-            self._print_banner()
-
-        elif command == "/reset":
-            self._reset_state()
-
-        elif command == "/tools":
-            self._handle_tools(args)
-
-        elif command == "/benchmark":
-            self._handle_benchmark(args)
-
-        elif command == "/loop":
-            self._handle_loop(args)
-
-        elif command == "/reindex":
-            self._reindex_workspace()
-
-        elif command == "/newchat":
-            self._new_chat()
+                method()
+            return True
+
+        console.print(f"[yellow]Unknown command: {command}[/yellow]")
+        # Suggest closest match
+        close = _SUGGESTIONS.get(command[:3])
+        if close:
+            console.print(f"[dim]Did you mean: {', '.join(close)}?[/dim]")
+        else:
+            console.print("[dim]Type /help for available commands[/dim]")
+        return True
 
+    def _model_command(self, args: str) -> None:
+        """/model with a name switches model; bare /model lists them."""
+        if args:
+            self._switch_model(args)
         else:
-            console.print(f"[yellow]Unknown command: {command}[/yellow]")
-            # Suggest closest match
-            known = ["/help", "/status", "/history", "/models", "/model",
-                     "/tools", "/benchmark", "/loop", "/reindex", "/newchat",
-                     "/clear", "/reset", "/exit", "/quit"]
-            close = [c for c in known if c.startswith(command[:3])]
-            if close:
-                console.print(f"[dim]Did you mean: {', '.join(close)}?[/dim]")
-            else:
-                console.print("[dim]Type /help for available commands[/dim]")
+            self._list_models()
 
-        return True
+    def _clear_screen(self) -> None:
+        """Clear the terminal and redraw the banner."""
+        console.clear()
+        self._print_banner()
 
     def _handle_loop(self, args: str):
         """Handle /loop commands (coding loop status/resume/reset)."""
@@ -804,8 +947,7 @@ class GeekCodeREPL:
             if result:
                 console.print()
                 try:
-                    from rich.markdown import Markdown as _Md
-                    console.print(_Md(result.final_output))
+                    _print_markdown(result.final_output)
                 except Exception:
                     console.print(result.final_output)
             else:
@@ -830,8 +972,7 @@ class GeekCodeREPL:
         sub = parts[0] if parts else "list"
 
         try:
-            from geekcode.mcporter.registry import ToolRegistry
-            registry = ToolRegistry(self.geekcode_dir)
+            registry = self._get_tool_registry()
         except Exception as e:
             console.print(f"[red]MCPorter error: {e}[/red]")
             return
@@ -865,12 +1006,7 @@ class GeekCodeREPL:
                     )
 
         elif sub == "refresh":
-            import yaml as _yaml
-            config_file = self.geekcode_dir / "config.yaml"
-            config = {}
-            if config_file.exists():
-                with open(config_file) as f:
-                    config = _yaml.safe_load(f) or {}
+            config = self._load_yaml(self.geekcode_dir / "config.yaml")
 
             mcporter_cfg = config.get("mcporter", {})
             if not mcporter_cfg.get("enabled"):
@@ -964,6 +1100,11 @@ class GeekCodeREPL:
     def run(self):
         """Run the interactive REPL."""
         self._print_banner()
+        # Keys typed during startup are still queued; the first prompt reads them
+        stop_capturing_early_input()
+        # Load the Markdown renderer while the user types the first task
+        import threading
+        threading.Thread(target=_preload_markdown, name="preload-markdown", daemon=True).start()
 
         while self.running:
             try:
@@ -1098,7 +1239,8 @@ def cli(version: bool, init: bool, task: tuple) -> None:
             sys.exit(1)
         return
 
-    # Interactive mode
+    # Interactive mode: hold keystrokes typed while the REPL starts up
+    start_capturing_early_input()
     repl = GeekCodeREPL(workspace)
     repl.run()
 
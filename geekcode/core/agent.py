@@ -10,6 +10,7 @@ Every task execution:
 """
 
 import hashlib
+import json
 import os
 from dataclasses import dataclass
 from datetime import datetime
@@ -18,6 +19,16 @@ from typing import Any, Dict, List, Optional
 
 import yaml
 
+from geekcode.utils.yaml_io import YamlDumper, YamlLoader
+
+# JSON-lines copy of the most recent history entries, oldest first, so readers
+# can tail them without parsing each daily YAML file. Once the file passes
+# HISTORY_INDEX_MAX_BYTES it is cut back to the newest HISTORY_INDEX_KEEP
+# entries; the daily files keep the full history.
+HISTORY_INDEX = "index.jsonl"
+HISTORY_INDEX_KEEP = 1000
+HISTORY_INDEX_MAX_BYTES = 1 << 20
+
 
 @dataclass
 class TaskResult:
@@ -83,7 +94,7 @@ class Agent:
         if meta_path.exists():
             try:
                 with open(meta_path) as f:
-                    meta = yaml.safe_load(f) or {}
+                    meta = yaml.load(f, Loader=YamlLoader) or {}
                 last_indexed = meta.get("last_indexed")
                 if last_indexed:
                     last_time = datetime.fromisoformat(last_indexed)
@@ -105,10 +116,10 @@ class Agent:
             meta = {}
             if meta_path.exists():
                 with open(meta_path) as f:
-                    meta = yaml.safe_load(f) or {}
+                    meta = yaml.load(f, Loader=YamlLoader) or {}
             meta["last_indexed"] = now.isoformat()
             with open(meta_path, "w") as f:
-                yaml.dump(meta, f, default_flow_style=False)
+                yaml.dump(meta, f, Dumper=YamlDumper, default_flow_style=False)
         except Exception:
             pass
 
@@ -244,7 +255,7 @@ class Agent:
         state_file = self.geekcode_dir / "state.yaml"
         if state_file.exists():
             with open(state_file) as f:
-                return yaml.safe_load(f) or {}
+                return yaml.load(f, Loader=YamlLoader) or {}
         return {"status": "idle"}
 
     def _read_config(self) -> Dict[str, Any]:
@@ -257,7 +268,7 @@ class Agent:
         local_file = self.geekcode_dir / "config.yaml"
         if local_file.exists():
             with open(local_file) as f:
-                config = yaml.safe_load(f) or {}
+                config = yaml.load(f, Loader=YamlLoader) or {}
         return config
 
     def _read_conversation(self) -> List[Dict[str, str]]:
@@ -265,7 +276,7 @@ class Agent:
         conv_file = self.geekcode_dir / "conversation.yaml"
         if conv_file.exists():
             with open(conv_file) as f:
-                return yaml.safe_load(f) or []
+                return yaml.load(f, Loader=YamlLoader) or []
         return []
 
     def _read_cache(self, task_id: str) -> Optional[str]:
@@ -275,7 +286,7 @@ class Agent:
             return None
 
         with open(cache_file) as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=YamlLoader) or {}
 
         # Check TTL
         cached_at = data.get("cached_at", "")
@@ -297,7 +308,7 @@ class Agent:
         """Write state to .geekcode/state.yaml"""
         state_file = self.geekcode_dir / "state.yaml"
         with open(state_file, "w") as f:
-            yaml.dump(state, f, default_flow_style=False)
+            yaml.dump(state, f, Dumper=YamlDumper, default_flow_style=False)
 
     def _write_conversation(self, conversation: List[Dict[str, str]]) -> None:
         """Write conversation to .geekcode/conversation.yaml"""
@@ -305,7 +316,7 @@ class Agent:
         conversation = conversation[-20:]
         conv_file = self.geekcode_dir / "conversation.yaml"
         with open(conv_file, "w") as f:
-            yaml.dump(conversation, f, default_flow_style=False)
+            yaml.dump(conversation, f, Dumper=YamlDumper, default_flow_style=False)
 
     def _write_cache(self, task_id: str, response: str) -> None:
         """Write response to cache file."""
@@ -317,7 +328,7 @@ class Agent:
             yaml.dump({
                 "cached_at": datetime.utcnow().isoformat(),
                 "response": response,
-            }, f, default_flow_style=False)
+            }, f, Dumper=YamlDumper, default_flow_style=False)
 
     def _write_history(self, task: str, response: str, cached: bool) -> None:
         """Append to daily history file."""
@@ -330,17 +341,48 @@ class Agent:
         history = []
         if history_file.exists():
             with open(history_file) as f:
-                history = yaml.safe_load(f) or []
+                history = yaml.load(f, Loader=YamlLoader) or []
 
-        history.append({
+        entry = {
             "timestamp": datetime.utcnow().isoformat(),
             "task": task[:200],
             "response_preview": response[:200],
             "cached": cached,
-        })
+        }
+        history.append(entry)
 
         with open(history_file, "w") as f:
-            yaml.dump(history, f, default_flow_style=False)
+            yaml.dump(history, f, Dumper=YamlDumper, default_flow_style=False)
+
+        index_file = history_dir / HISTORY_INDEX
+        if index_file.exists():
+            with open(index_file, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+                size = f.tell()
+            if size > HISTORY_INDEX_MAX_BYTES:
+                with open(index_file) as f:
+                    lines = f.readlines()
+                self._replace_history_index(index_file, lines)
+        else:
+            self._rebuild_history_index(history_dir)
+
+    @staticmethod
+    def _rebuild_history_index(history_dir: Path) -> None:
+        """Write the history index from the daily YAML files (one-time migration)."""
+        lines = []
+        for history_file in sorted(history_dir.glob("*.yaml")):
+            with open(history_file) as f:
+                for entry in yaml.load(f, Loader=YamlLoader) or []:
+                    lines.append(json.dumps(entry, default=str) + "\n")
+        Agent._replace_history_index(history_dir / HISTORY_INDEX, lines)
+
+    @staticmethod
+    def _replace_history_index(index_file: Path, lines: List[str]) -> None:
+        """Atomically rewrite the history index with the newest HISTORY_INDEX_KEEP lines."""
+        tmp = index_file.with_name(index_file.name + ".tmp")
+        with open(tmp, "w") as f:
+            f.write("".join(lines[-HISTORY_INDEX_KEEP:]))
+        os.replace(tmp, index_file)
 
     def _increment_cache_hits(self) -> None:
         """Increment cache hit counter in meta file."""
@@ -348,13 +390,13 @@ class Agent:
         meta = {}
         if meta_file.exists():
             with open(meta_file) as f:
-                meta = yaml.safe_load(f) or {}
+                meta = yaml.load(f, Loader=YamlLoader) or {}
 
         meta["hits"] = meta.get("hits", 0) + 1
         meta["tokens_saved"] = meta.get("tokens_saved", 0) + 500  # Estimate
 
         with open(meta_file, "w") as f:
-            yaml.dump(meta, f, default_flow_style=False)
+            yaml.dump(meta, f, Dumper=YamlDumper, default_flow_style=False)
 
     # === CONTEXT BUILDING ===
 
@@ -419,7 +461,7 @@ class Agent:
 
                 if index_file.exists():
                     with open(index_file) as f:
-                        index = yaml.safe_load(f) or {}
+                        index = yaml.load(f, Loader=YamlLoader) or {}
                     for path, info in index.items():
                         if info.get("hash", "")[:8] == source[:8]:
                             source = path
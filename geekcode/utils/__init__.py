@@ -0,0 +1,5 @@
+"""
+GeekCode utilities.
+
+Small helpers shared by the package and the benchmark pipeline.
+"""
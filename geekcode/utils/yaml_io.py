@@ -0,0 +1,15 @@
+"""
+YAML loader/dumper selection.
+
+Uses the libyaml C bindings when PyYAML was built with them, falling back to
+the pure-Python safe classes otherwise.
+"""
+
+try:  # libyaml C bindings when available
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeDumper as YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
+__all__ = ["YamlDumper", "YamlLoader"]
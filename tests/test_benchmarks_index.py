@@ -0,0 +1,93 @@
+"""Tests for the benchmark metrics index sidecar."""
+
+import json
+import os
+
+from benchmarks.models import (
+    METRICS_INDEX,
+    BenchmarkResult,
+    TaskMetrics,
+    load_metrics_index_by_file,
+)
+
+
+def _result(task_id, accuracy):
+    return BenchmarkResult(
+        agent="geekcode",
+        domain="coding",
+        task_id=task_id,
+        metrics=TaskMetrics(accuracy=accuracy, latency_seconds=1.5),
+    )
+
+
+def _touch(path, mtime_ns):
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestMetricsIndex:
+    """Tests for load_metrics_index_by_file and its rebuild path."""
+
+    def test_save_many_writes_index(self, tmp_path):
+        BenchmarkResult.save_many([_result(1, 0.5), _result(2, 0.75)], base_dir=tmp_path)
+
+        indexed = load_metrics_index_by_file(tmp_path / "geekcode")
+
+        assert indexed is not None
+        assert indexed["coding/baseline_task1.yaml"].accuracy == 0.5
+        assert indexed["coding/baseline_task2.yaml"].accuracy == 0.75
+
+    def test_missing_index_returns_none(self, tmp_path):
+        (tmp_path / "geekcode" / "coding").mkdir(parents=True)
+
+        assert load_metrics_index_by_file(tmp_path / "geekcode") is None
+
+    def test_stale_yaml_triggers_rebuild(self, tmp_path):
+        path = _result(1, 0.5).save(base_dir=tmp_path)
+        agent_dir = tmp_path / "geekcode"
+        index_path = agent_dir / METRICS_INDEX
+        saved_at = index_path.stat().st_mtime_ns
+        _touch(index_path, saved_at - 10_000_000_000)
+
+        # Edit the YAML behind the index's back, with a newer mtime
+        _result(1, 0.9)._write(path.parent)
+        _touch(path, saved_at - 5_000_000_000)
+
+        indexed = load_metrics_index_by_file(agent_dir)
+
+        assert indexed is not None
+        assert indexed["coding/baseline_task1.yaml"].accuracy == 0.9
+        entries = [json.loads(line) for line in index_path.read_text().splitlines()]
+        assert entries == [
+            {"file": "coding/baseline_task1.yaml", "metrics": TaskMetrics(0.9, 1.5).to_dict()}
+        ]
+
+    def test_duplicate_entries_are_compacted(self, tmp_path):
+        result = _result(1, 0.5)
+        result.save(base_dir=tmp_path)
+        result.metrics.accuracy = 0.6
+        result.save(base_dir=tmp_path)
+        index_path = tmp_path / "geekcode" / METRICS_INDEX
+
+        indexed = load_metrics_index_by_file(tmp_path / "geekcode")
+
+        assert indexed is not None
+        assert indexed["coding/baseline_task1.yaml"].accuracy == 0.6
+        assert len(index_path.read_text().splitlines()) == 1
+
+    def test_unreadable_yaml_is_recorded_once(self, tmp_path):
+        BenchmarkResult.save_many([_result(1, 0.5)], base_dir=tmp_path)
+        agent_dir = tmp_path / "geekcode"
+        (agent_dir / "coding" / "broken_task2.yaml").write_text("metrics: [unclosed\n")
+        index_path = agent_dir / METRICS_INDEX
+
+        first = load_metrics_index_by_file(agent_dir)
+        entries = [json.loads(line) for line in index_path.read_text().splitlines()]
+        mtime = index_path.stat().st_mtime_ns
+
+        second = load_metrics_index_by_file(agent_dir)
+
+        assert first is not None and second is not None
+        assert list(first) == list(second) == ["coding/baseline_task1.yaml"]
+        assert {"file": "coding/broken_task2.yaml", "error": True} in entries
+        # The read path leaves a consistent index alone
+        assert index_path.stat().st_mtime_ns == mtime
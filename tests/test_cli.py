@@ -0,0 +1,305 @@
+"""Tests for the interactive CLI."""
+
+import io
+import json
+import os
+import socket
+
+import pytest
+import yaml
+
+from geekcode.cli import main as cli_main
+from geekcode.cli._early_input import start_capturing_early_input, stop_capturing_early_input
+from geekcode.cli.main import (
+    GeekCodeREPL,
+    _atomic_write,
+    _detect_ollama,
+    _print_markdown,
+    _tail_lines,
+    find_workspace,
+)
+from geekcode.core import agent as agent_module
+from geekcode.core.agent import HISTORY_INDEX, Agent
+
+
+@pytest.fixture
+def repl(tmp_path, monkeypatch):
+    """A REPL on a fresh workspace, without a prompt_toolkit session."""
+    monkeypatch.setattr(GeekCodeREPL, "_init_prompt_session", lambda self: None)
+    return GeekCodeREPL(tmp_path)
+
+
+class TestYamlCache:
+    """Tests for the REPL's config/state parse cache."""
+
+    def test_missing_file_loads_empty(self, repl):
+        """A missing file loads as an empty dict."""
+        assert repl._load_yaml(repl.geekcode_dir / "missing.yaml") == {}
+
+    def test_unchanged_file_is_not_reparsed(self, repl, monkeypatch):
+        """Repeated loads of an unchanged file reuse the first parse."""
+        config_file = repl.geekcode_dir / "config.yaml"
+        first = repl._load_yaml(config_file)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("config.yaml parsed again")
+
+        monkeypatch.setattr(yaml, "load", fail)
+        assert repl._load_yaml(config_file) == first
+
+    def test_mutating_result_leaves_cache_intact(self, repl):
+        """Callers get copies; changing one doesn't affect later loads."""
+        config_file = repl.geekcode_dir / "config.yaml"
+        config = repl._load_yaml(config_file)
+        model = config["model"]
+
+        config["model"] = "changed"
+        config["project"]["name"] = "changed"
+        again = repl._load_yaml(config_file)
+        assert again["model"] == model
+        assert again["project"]["name"] != "changed"
+
+    def test_external_write_invalidates(self, repl):
+        """Edits made outside the REPL are picked up."""
+        state_file = repl.geekcode_dir / "state.yaml"
+        assert repl._load_yaml(state_file)["status"] == "idle"
+
+        state_file.write_text("status: running\ncurrent_task: build\n")
+        st = state_file.stat()
+        os.utime(state_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert repl._load_yaml(state_file)["status"] == "running"
+
+    def test_switch_model_updates_cache(self, repl):
+        """Writes through the REPL refresh the cached parse."""
+        config_file = repl.geekcode_dir / "config.yaml"
+        repl._load_yaml(config_file)
+        repl._switch_model("openai/gpt-4o")
+
+        assert repl._load_yaml(config_file)["model"] == "openai/gpt-4o"
+        with open(config_file) as f:
+            assert yaml.safe_load(f)["model"] == "openai/gpt-4o"
+
+    def test_atomic_write_replaces_file(self, tmp_path):
+        """The target is replaced in full and no temp file is left behind."""
+        path = tmp_path / "state.yaml"
+        path.write_text("status: running\ncurrent_task: a long task description\n")
+
+        _atomic_write(path, b"status: idle\n")
+        assert path.read_bytes() == b"status: idle\n"
+        assert [p.name for p in tmp_path.iterdir()] == ["state.yaml"]
+
+    def test_interrupted_write_keeps_old_file(self, repl, monkeypatch):
+        """A failure before the rename leaves the previous contents intact."""
+        state_file = repl.geekcode_dir / "state.yaml"
+        before = state_file.read_bytes()
+
+        def interrupted(src, dst):
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(os, "replace", interrupted)
+        with pytest.raises(KeyboardInterrupt):
+            repl._reset_state()
+        assert state_file.read_bytes() == before
+        assert not (repl.geekcode_dir / "state.yaml.tmp").exists()
+
+
+class TestEarlyInput:
+    """Tests for startup keystroke capture."""
+
+    @pytest.fixture
+    def tty(self):
+        """The slave end of a pseudo-terminal, opened as a text stream."""
+        termios = pytest.importorskip("termios")
+        master, slave = os.openpty()
+        stream = os.fdopen(slave, "r")
+        yield termios, master, stream
+        stream.close()
+        os.close(master)
+
+    def test_noop_without_terminal(self, tmp_path):
+        """Non-terminal input is left alone."""
+        with open(tmp_path / "input.txt", "w+") as stream:
+            assert start_capturing_early_input(stream) is False
+        stop_capturing_early_input()
+
+    def test_echo_disabled_then_restored(self, tty):
+        """Echo is off while capturing and restored afterwards, keeping typed input."""
+        termios, master, stream = tty
+        fd = stream.fileno()
+        before = termios.tcgetattr(fd)
+
+        assert start_capturing_early_input(stream) is True
+        try:
+            assert not termios.tcgetattr(fd)[3] & termios.ECHO
+            os.write(master, b"hello")
+        finally:
+            stop_capturing_early_input()
+
+        assert termios.tcgetattr(fd) == before
+        attrs = termios.tcgetattr(fd)
+        attrs[3] &= ~termios.ICANON
+        termios.tcsetattr(fd, termios.TCSANOW, attrs)
+        assert os.read(fd, 5) == b"hello"
+
+
+class TestHistory:
+    """Tests for reading task history."""
+
+    def test_tail_lines(self, tmp_path):
+        """Only the last lines are returned, across block boundaries."""
+        path = tmp_path / "log.txt"
+        path.write_text("".join(f"line {i}\n" for i in range(1000)))
+
+        assert _tail_lines(path, 3, block_size=16) == ["line 997", "line 998", "line 999"]
+        assert _tail_lines(path, 2000) == [f"line {i}" for i in range(1000)]
+
+    def test_recent_history_from_index(self, repl):
+        """The index is read newest first."""
+        history_dir = repl.geekcode_dir / "history"
+        entries = [{"timestamp": f"2024-01-01T00:00:{i:02d}", "task": f"t{i}"} for i in range(15)]
+        (history_dir / HISTORY_INDEX).write_text("".join(json.dumps(e) + "\n" for e in entries))
+
+        recent = repl._recent_history(history_dir, 10)
+        assert [e["task"] for e in recent] == [f"t{i}" for i in range(14, 4, -1)]
+
+    def test_recent_history_without_index(self, repl):
+        """Daily YAML files are used when no index exists."""
+        history_dir = repl.geekcode_dir / "history"
+        for day, tasks in (("2024-01-01", ["a", "b"]), ("2024-01-02", ["c", "d"])):
+            with open(history_dir / f"{day}.yaml", "w") as f:
+                yaml.dump([{"timestamp": f"{day}T00:00:00", "task": t} for t in tasks], f)
+
+        assert [e["task"] for e in repl._recent_history(history_dir, 3)] == ["d", "c", "b"]
+
+    def test_index_rebuilt_from_daily_files(self, tmp_path):
+        """The index is backfilled from existing daily files, oldest first."""
+        for day, tasks in (("2024-01-02", ["c"]), ("2024-01-01", ["a", "b"])):
+            with open(tmp_path / f"{day}.yaml", "w") as f:
+                yaml.dump([{"timestamp": f"{day}T00:00:00", "task": t} for t in tasks], f)
+
+        Agent._rebuild_history_index(tmp_path)
+
+        lines = (tmp_path / HISTORY_INDEX).read_text().splitlines()
+        assert [json.loads(line)["task"] for line in lines] == ["a", "b", "c"]
+
+    def test_index_trimmed_past_size_limit(self, tmp_path, monkeypatch):
+        """An oversized index is cut back to the newest entries on the next write."""
+        monkeypatch.setattr(agent_module, "HISTORY_INDEX_KEEP", 5)
+        monkeypatch.setattr(agent_module, "HISTORY_INDEX_MAX_BYTES", 512)
+        agent = Agent(tmp_path)
+        for i in range(20):
+            agent._write_history(f"task {i}", "ok", cached=False)
+
+        index_file = agent.geekcode_dir / "history" / HISTORY_INDEX
+        assert index_file.stat().st_size <= 512 + 200
+        tasks = [json.loads(line)["task"] for line in index_file.read_text().splitlines()]
+        assert tasks[-1] == "task 19"
+        assert len(tasks) < 20
+
+
+class TestDetectOllama:
+    """Tests for the Ollama port probe."""
+
+    def test_detects_listener(self, monkeypatch):
+        """A listening socket on the Ollama port counts as running."""
+        connected = []
+
+        class FakeConnection:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+        def fake_connect(address, timeout):
+            connected.append(address)
+            return FakeConnection()
+
+        monkeypatch.setattr(socket, "create_connection", fake_connect)
+        assert _detect_ollama() is True
+        assert connected == [("localhost", 11434)]
+
+    def test_refused_connection(self, monkeypatch):
+        """Connection errors mean Ollama is not running."""
+        def refuse(address, timeout):
+            raise ConnectionRefusedError
+
+        monkeypatch.setattr(socket, "create_connection", refuse)
+        assert _detect_ollama() is False
+
+
+class TestPrintMarkdown:
+    """Tests for line-by-line Markdown rendering."""
+
+    SAMPLE = (
+        "# Title\n\nSome **bold** text.\n\n"
+        "```python\ndef f():\n\n    return 1\n```\n\n"
+        "1. one\n\n2. two\n\n| a | b |\n|---|---|\n| 1 | 2 |\n"
+    )
+
+    @staticmethod
+    def _console():
+        from rich.console import Console
+
+        return Console(file=io.StringIO(), width=60, force_terminal=True)
+
+    def test_matches_full_render(self, monkeypatch):
+        """Streaming the lines produces the same output as printing the whole document."""
+        from rich.markdown import Markdown
+
+        expected = self._console()
+        expected.print(Markdown(self.SAMPLE))
+
+        streamed = self._console()
+        monkeypatch.setattr(cli_main, "console", streamed)
+        _print_markdown(self.SAMPLE)
+
+        assert streamed.file.getvalue() == expected.file.getvalue()
+
+
+class TestFindWorkspace:
+    """Tests for workspace discovery."""
+
+    def test_finds_nearest_ancestor(self, tmp_path, monkeypatch):
+        """The closest ancestor holding .geekcode/ is the workspace."""
+        (tmp_path / ".geekcode").mkdir()
+        nested = tmp_path / "src" / "pkg"
+        nested.mkdir(parents=True)
+        monkeypatch.chdir(nested)
+
+        assert find_workspace() == tmp_path
+
+    def test_defaults_to_cwd(self, tmp_path, monkeypatch):
+        """Without any .geekcode/ the current directory is used."""
+        monkeypatch.chdir(tmp_path)
+
+        assert find_workspace() == tmp_path
+
+
+class TestHandleCommand:
+    """Tests for slash-command dispatch."""
+
+    def test_exit_commands_stop_the_loop(self, repl):
+        """Exit commands return False and stop the REPL."""
+        assert repl._handle_command("/QUIT") is False
+        assert repl.running is False
+
+    def test_dispatch_with_and_without_args(self, repl, monkeypatch):
+        """Handlers receive the argument string only when they take one."""
+        calls = []
+        monkeypatch.setattr(repl, "_handle_loop", lambda args: calls.append(("loop", args)))
+        monkeypatch.setattr(repl, "_print_status", lambda: calls.append(("status",)))
+        monkeypatch.setattr(repl, "_switch_model", lambda name: calls.append(("switch", name)))
+        monkeypatch.setattr(repl, "_list_models", lambda: calls.append(("models",)))
+
+        for cmd in ("/loop reset", "/status", "/model groq/x", "/model"):
+            assert repl._handle_command(cmd) is True
+
+        assert calls == [("loop", "reset"), ("status",), ("switch", "groq/x"), ("models",)]
+
+    def test_unknown_command_suggests(self, repl, capsys):
+        """Unknown commands suggest known ones sharing their first characters."""
+        repl._handle_command("/h")
+        out = capsys.readouterr().out
+        assert "Unknown command: /h" in out
+        assert "Did you mean: /help, /history?" in out
@@ -0,0 +1,90 @@
+"""Tests for the REPL completer."""
+
+from prompt_toolkit.document import Document
+
+from geekcode.cli import completer as completer_mod
+from geekcode.cli.completer import KNOWN_MODELS, SLASH_COMMANDS, GeekCodeCompleter
+
+
+def _complete(completer, text):
+    return [c.text for c in completer.get_completions(Document(text), None)]
+
+
+class TestGeekCodeCompleter:
+    """Tests for GeekCodeCompleter."""
+
+    def test_no_completions_without_slash(self):
+        """Plain input is never completed."""
+        assert _complete(GeekCodeCompleter(), "help") == []
+
+    def test_all_commands_for_bare_slash(self):
+        """A bare "/" lists every command in declaration order."""
+        assert _complete(GeekCodeCompleter(), "/") == [cmd for cmd, _ in SLASH_COMMANDS]
+
+    def test_command_prefix(self):
+        """Only commands sharing the typed prefix are offered, in declaration order."""
+        assert _complete(GeekCodeCompleter(), "/lo") == ["/loop", "/loop resume", "/loop reset"]
+        assert _complete(GeekCodeCompleter(), "/q") == ["/quit", "/q"]
+        assert _complete(GeekCodeCompleter(), "/zzz") == []
+
+    def test_completion_metadata(self):
+        """Completions replace the typed text and carry the description."""
+        (completion,) = GeekCodeCompleter().get_completions(Document("/hel"), None)
+        assert completion.text == "/help"
+        assert completion.start_position == -4
+        assert completion.display_meta_text == "Show help"
+
+    def test_models_completion(self):
+        """"/models" completes as a command, "/model " completes model names."""
+        assert _complete(GeekCodeCompleter(), "/models") == ["/models"]
+        assert _complete(GeekCodeCompleter(), "/model ") == [m for m, _ in KNOWN_MODELS]
+
+    def test_model_prefix_is_case_insensitive(self):
+        """Model prefixes match regardless of case."""
+        assert _complete(GeekCodeCompleter(), "/model GROQ/LLAMA") == [
+            "groq/llama-3.3-70b-versatile",
+            "groq/llama-3.1-8b-instant",
+        ]
+
+    def test_ollama_models_listed_first(self):
+        """Local Ollama models come before static suggestions."""
+        completer = GeekCodeCompleter(ollama_models_fn=lambda: ["llama3", "qwen2"])
+        assert _complete(completer, "/model ")[:2] == ["ollama/llama3", "ollama/qwen2"]
+        assert _complete(completer, "/model qw") == ["ollama/qwen2"]
+
+    def test_ollama_errors_are_ignored(self):
+        """A failing Ollama lookup still yields static models."""
+        def boom():
+            raise RuntimeError("ollama down")
+
+        assert _complete(GeekCodeCompleter(ollama_models_fn=boom), "/model openai/o1") == [
+            "openai/o1",
+            "openai/o1-mini",
+        ]
+
+    def test_ollama_models_cached_within_ttl(self, monkeypatch):
+        """The Ollama lookup runs once per TTL window, not once per keystroke."""
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return ["llama3"]
+
+        clock = [100.0]
+        monkeypatch.setattr(completer_mod.time, "monotonic", lambda: clock[0])
+        completer = GeekCodeCompleter(ollama_models_fn=fetch)
+        for text in ("/model ", "/model o", "/model ol"):
+            _complete(completer, text)
+        assert len(calls) == 1
+
+        clock[0] += completer_mod.OLLAMA_CACHE_TTL
+        _complete(completer, "/model oll")
+        assert len(calls) == 2
+
+    def test_static_completions_are_reused(self):
+        """Repeated keystrokes reuse the same static Completion objects."""
+        completer = GeekCodeCompleter()
+        first = list(completer.get_completions(Document("/he"), None))
+        second = list(completer.get_completions(Document("/he"), None))
+        assert first == second
+        assert all(a is b for a, b in zip(first, second))